@@ -7,20 +7,48 @@ easy to read for teaching purposes.
 
 from __future__ import annotations
 
-import json
 import os
-from typing import Any
+import shutil
+import sys
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from src.core.factory import GameFactory
-from src.core.gomoku import GomokuGame
-from src.core.go import GoGame
 from src.core.board import Board
-from src.core.game import Game, GameStatus
+from src.core.game import Game
+from src.core.serialization import game_type_of, load_game, save_game
+
+# maps the board's byte codes (0 empty, 1 black, 2 white) to display chars
+_RENDER_TABLE = bytes.maketrans(bytes([0, 1, 2]), b".XO")
+
+# returned by a command handler to leave the game loop for the main menu
+_BACK_TO_MENU = object()
+# what a command handler returns: None, a loaded (game, game_type) or _BACK_TO_MENU
+CommandResult = Optional[Union[Tuple[Game, str], object]]
 
 
 class ConsoleClient:
     def __init__(self, factory: GameFactory):
         self.factory = factory
+        # on a real (POSIX) terminal the board is pinned to the top of the
+        # screen and only rows that changed since the last draw are rewritten
+        self._ansi = sys.stdout.isatty() and os.name != "nt"
+        self._last_grid_snapshot: bytes | None = None
+        # set while the terminal's scroll region is confined below a
+        # pinned board; kept apart from the snapshot, which a full redraw
+        # may drop while the region is still in force
+        self._scroll_region = False
+        # command word -> handler, built once instead of an if/elif ladder
+        self._handlers: Dict[str, Callable[[list[str], Game, str], CommandResult]] = {
+            "help": self._cmd_help,
+            "move": self._cmd_move,
+            "pass": self._cmd_pass,
+            "undo": self._cmd_undo,
+            "resign": self._cmd_resign,
+            "save": self._cmd_save,
+            "load": self._cmd_load,
+            "restart": self._cmd_restart,
+            "quit": self._cmd_quit,
+        }
 
     def run(self) -> None:
         """Run the main client loop."""
@@ -65,6 +93,13 @@ class ConsoleClient:
             return size
 
     def _game_loop(self, game: Game, game_type: str) -> None:
+        try:
+            self._play(game, game_type)
+        finally:
+            # hand the whole screen back before returning to the menu
+            self._reset_display()
+
+    def _play(self, game: Game, game_type: str) -> None:
         while True:
             self._display_board(game.board)
             cur = game.current_player
@@ -74,93 +109,18 @@ class ConsoleClient:
             if not cmd:
                 continue
             parts = cmd.split()
-            action = parts[0].lower()
 
             # 每个命令分别处理常见错误并给出友好提示，保证循环不中断
-            if action == "help":
-                self._print_help()
-            elif action == "move":
-                if len(parts) != 3:
-                    print("用法: move x y （x 和 y 为从 0 开始的行列索引）")
-                    continue
-                try:
-                    x = int(parts[1])
-                    y = int(parts[2])
-                except ValueError:
-                    print("坐标需为整数。")
-                    continue
-                try:
-                    game.make_move(x, y)
-                except ValueError as e:
-                    # 包括非法位置、禁手或自杀等由游戏层抛出的错误
-                    print(f"落子失败（无效位置或规则不允许）: {e}")
-                    continue
-                except Exception as e:
-                    print(f"落子失败: {e}")
-                    continue
-            elif action == "pass":
-                try:
-                    game.pass_turn()
-                except NotImplementedError:
-                    print("此游戏不支持 pass。")
-                except ValueError as e:
-                    print(f"pass 失败: {e}")
-                except Exception as e:
-                    print(f"pass 失败: {e}")
-            elif action == "undo":
-                try:
-                    game.undo()
-                except ValueError as e:
-                    # 例如没有可悔棋的步数
-                    print(f"无法悔棋: {e}")
-                except Exception as e:
-                    print(f"无法悔棋: {e}")
-            elif action == "resign":
-                try:
-                    game.resign()
-                except Exception as e:
-                    print(f"认输失败: {e}")
-            elif action == "save":
-                if len(parts) != 2:
-                    print("用法: save filename")
-                    continue
-                try:
-                    self._save_game(game, parts[1], game_type)
-                except IOError as e:
-                    print(f"保存失败（IO 错误）: {e}")
-                except Exception as e:
-                    print(f"保存失败: {e}")
-            elif action == "load":
-                if len(parts) != 2:
-                    print("用法: load filename")
-                    continue
-                try:
-                    loaded = self._load_game(parts[1])
-                except FileNotFoundError:
-                    print("加载失败: 文件不存在。")
-                    continue
-                except IOError as e:
-                    print(f"加载失败（IO 错误）: {e}")
-                    continue
-                except ValueError as e:
-                    print(f"加载失败: {e}")
-                    continue
-                except Exception as e:
-                    print(f"加载失败: {e}")
-                    continue
-
-                if loaded is None:
-                    print("加载失败。")
-                    continue
-                game, game_type = loaded
-            elif action == "restart":
-                print("回到主菜单。")
-                return
-            elif action == "quit":
-                print("退出程序。")
-                raise SystemExit
-            else:
+            handler = self._handlers.get(parts[0].lower())
+            if handler is None:
                 print("未知命令，输入 'help' 查看帮助。")
+                continue
+            result = handler(parts, game, game_type)
+            if result is _BACK_TO_MENU:
+                return
+            if result is not None:
+                # a successful load replaces the current game
+                game, game_type = result
 
             # check end of game
             if game.is_over():
@@ -173,117 +133,176 @@ class ConsoleClient:
                 print("返回主菜单。\n")
                 return
 
-    def _display_board(self, board: Board) -> None:
-        size = board.get_size()
-        # header
-        header = "   " + " ".join(f"{i:2d}" for i in range(size))
-        print(header)
-        for r in range(size):
-            row_str = []
-            for c in range(size):
-                v = board.get_piece(r, c)
-                ch = "."
-                if v == "black":
-                    ch = "X"
-                elif v == "white":
-                    ch = "O"
-                row_str.append(ch)
-            print(f"{r:2d} " + "  ".join(row_str))
+    # ----- command handlers -----
+    # Each takes (parts, game, game_type) and returns None to keep playing,
+    # a new (game, game_type) after a successful load, or _BACK_TO_MENU.
 
-    def _print_help(self) -> None:
-        print("命令说明:")
-        print("  move x y    在 (x,y) 落子，坐标为从 0 开始的行列索引")
-        print("  pass        围棋可用，跳过一回合")
-        print("  undo        悔棋一步")
-        print("  resign      投子认负")
-        print("  save f      保存当前局面到文件 f")
-        print("  load f      从文件 f 加载局面")
-        print("  restart     返回主菜单，重新开始")
-        print("  help        显示本帮助")
-        print("  quit        退出程序")
+    def _cmd_help(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
+        self._print_help()
+        return None
 
-    def _save_game(self, game: Game, filename: str, game_type: str) -> None:
-        data: dict[str, Any] = {}
-        data["game_type"] = game_type
-        data["size"] = game.board.get_size()
-        data["black_name"] = game.black_player.name
-        data["white_name"] = game.white_player.name
-        data["current_color"] = game.current_player.color
-        data["status"] = game.status.name
-        # board grid
-        size = game.board.get_size()
-        grid = [[game.board.get_piece(r, c) for c in range(size)] for r in range(size)]
-        data["grid"] = grid
-        # go-specific data
-        if isinstance(game, GoGame):
-            data["captured_black"] = game.captured_black
-            data["captured_white"] = game.captured_white
-            # consecutive passes
-            data["consecutive_passes"] = getattr(game, "_consecutive_passes", 0)
+    def _cmd_move(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
+        if len(parts) != 3:
+            print("用法: move x y （x 和 y 为从 0 开始的行列索引）")
+            return None
+        try:
+            x = int(parts[1])
+            y = int(parts[2])
+        except ValueError:
+            print("坐标需为整数。")
+            return None
+        try:
+            game.make_move(x, y)
+        except ValueError as e:
+            # 包括非法位置、禁手或自杀等由游戏层抛出的错误
+            print(f"落子失败（无效位置或规则不允许）: {e}")
+        except Exception as e:
+            print(f"落子失败: {e}")
+        return None
 
+    def _cmd_pass(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"已保存到 {filename}")
+            game.pass_turn()
+        except NotImplementedError:
+            print("此游戏不支持 pass。")
+        except ValueError as e:
+            print(f"pass 失败: {e}")
         except Exception as e:
-            print(f"保存失败: {e}")
+            print(f"pass 失败: {e}")
+        return None
 
-    def _load_game(self, filename: str) -> tuple[Game, str] | None:
-        if not os.path.exists(filename):
-            print("文件不存在：", filename)
-            return None
+    def _cmd_undo(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            game.undo()
+        except ValueError as e:
+            # 例如没有可悔棋的步数
+            print(f"无法悔棋: {e}")
         except Exception as e:
-            print(f"读取文件失败: {e}")
-            return None
+            print(f"无法悔棋: {e}")
+        return None
 
-        game_type = data.get("game_type")
-        size = data.get("size")
-        if game_type not in ("gomoku", "go") or not isinstance(size, int):
-            print("文件格式不正确。")
+    def _cmd_resign(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
+        try:
+            game.resign()
+        except Exception as e:
+            print(f"认输失败: {e}")
+        return None
+
+    def _cmd_save(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
+        if len(parts) != 2:
+            print("用法: save filename")
             return None
+        try:
+            self._save_game(game, parts[1])
+        except IOError as e:
+            print(f"保存失败（IO 错误）: {e}")
+        except Exception as e:
+            print(f"保存失败: {e}")
+        return None
 
+    def _cmd_load(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
+        if len(parts) != 2:
+            print("用法: load filename")
+            return None
         try:
-            game = self.factory.create_game(game_type, size)
+            loaded = self._load_game(parts[1])
+        except FileNotFoundError:
+            print("加载失败: 文件不存在。")
+            return None
+        except IOError as e:
+            print(f"加载失败（IO 错误）: {e}")
+            return None
+        except ValueError as e:
+            print(f"加载失败: {e}")
+            return None
         except Exception as e:
-            print(f"创建游戏失败: {e}")
+            print(f"加载失败: {e}")
             return None
+        return loaded
+
+    def _cmd_restart(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
+        print("回到主菜单。")
+        return _BACK_TO_MENU
 
-        # reset board by placing pieces according to saved grid
-        grid = data.get("grid", [])
-        # clear any existing stones (new game is empty) and place
+    def _cmd_quit(self, parts: list[str], game: Game, game_type: str) -> CommandResult:
+        print("退出程序。")
+        raise SystemExit
+
+    def _display_board(self, board: Board) -> None:
+        size = board.get_size()
+        grid = board._grid
+        snapshot = bytes(grid)
+        last = self._last_grid_snapshot
+        if self._ansi and last is not None and len(last) == len(snapshot):
+            # rewrite only the rows that changed, in place; the cursor is
+            # saved/restored so the prompt area below is left alone
+            out = []
+            for r in range(size):
+                row = snapshot[r * size:(r + 1) * size]
+                if row != last[r * size:(r + 1) * size]:
+                    out.append(f"\x1b[{r + 2};1H\x1b[2K" + self._render_row(row, r))
+            if out:
+                sys.stdout.write("\x1b7" + "".join(out) + "\x1b8")
+                sys.stdout.flush()
+            self._last_grid_snapshot = snapshot
+            return
+
+        lines = shutil.get_terminal_size().lines
+        pinned = self._ansi and lines > size + 2
+        # build the whole board as one string and emit it with one write
+        out = []
+        if pinned:
+            # clear the screen and draw from the top-left corner
+            out.append("\x1b[r\x1b[2J\x1b[H")
+        elif self._scroll_region:
+            # a board that no longer fits: give the whole screen back first
+            out.append("\x1b[r")
+        # header
+        out.append("   " + " ".join(f"{i:2d}" for i in range(size)) + "\n")
         for r in range(size):
-            for c in range(size):
-                v = grid[r][c]
-                if v == Board.EMPTY:
-                    continue
-                try:
-                    game.board.place_piece(r, c, v)
-                except Exception as e:
-                    print(f"加载时设置格子失败 ({r},{c}): {e}")
-                    return None
-
-        # restore meta state
-        cur_color = data.get("current_color")
-        if cur_color == game.black_player.color:
-            game.current_player = game.black_player
-            game.other_player = game.white_player
-        else:
-            game.current_player = game.white_player
-            game.other_player = game.black_player
-
-        status_name = data.get("status")
-        try:
-            game.status = GameStatus[status_name]
-        except Exception:
-            game.status = GameStatus.ONGOING
+            out.append(self._render_row(grid[r * size:(r + 1) * size], r) + "\n")
+        if pinned:
+            # keep the board fixed: everything else scrolls below it
+            top = size + 2
+            out.append(f"\x1b[{top};{lines}r\x1b[{top};1H")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        self._scroll_region = pinned
+        self._last_grid_snapshot = snapshot if pinned else None
+
+    @staticmethod
+    def _render_row(row: bytes, r: int) -> str:
+        """Format one board row (raw cell codes) as display text."""
+        return f"{r:2d} " + "  ".join(row.translate(_RENDER_TABLE).decode("ascii"))
+
+    def _reset_display(self) -> None:
+        """Undo the board pinning so later output uses the full screen."""
+        if self._scroll_region:
+            lines = shutil.get_terminal_size().lines
+            sys.stdout.write(f"\x1b[r\x1b[{lines};1H\n")
+            sys.stdout.flush()
+            self._scroll_region = False
+        self._last_grid_snapshot = None
+
+    def _print_help(self) -> None:
+        print("命令说明:")
+        print("  move x y    在 (x,y) 落子，坐标为从 0 开始的行列索引")
+        print("  pass        围棋可用，跳过一回合")
+        print("  undo        悔棋一步")
+        print("  resign      投子认负")
+        print("  save f      保存当前局面到文件 f")
+        print("  load f      从文件 f 加载局面")
+        print("  restart     返回主菜单，重新开始")
+        print("  help        显示本帮助")
+        print("  quit        退出程序")
 
-        if isinstance(game, GoGame):
-            game.captured_black = int(data.get("captured_black", 0))
-            game.captured_white = int(data.get("captured_white", 0))
-            game._consecutive_passes = int(data.get("consecutive_passes", 0))
+    def _save_game(self, game: Game, filename: str) -> None:
+        # same flat file format as the GUI client (see src.core.serialization)
+        save_game(game, filename)
+        print(f"已保存到 {filename}")
 
+    def _load_game(self, filename: str) -> tuple[Game, str]:
+        # raises FileNotFoundError / ValueError, reported by _cmd_load
+        game = load_game(filename, self.factory)
         print(f"已从 {filename} 加载局面。")
-        return game, game_type
+        return game, game_type_of(game)
@@ -0,0 +1,98 @@
+"""Chain flood fill for Go, JIT-compiled with Numba when it is available.
+
+`chain_stones(grid, size, start)` walks the chain of stones that contains
+flat index `start` on a row-major board grid (0 = empty, 1 = black,
+2 = white) and returns the flat indices of the chain. Liberties are not
+looked at: `GoGame` tracks them per chain and only needs the stones of a
+chain it is capturing.
+
+Numba (and NumPy, which it requires) are optional. When they are not
+installed the same traversal runs as plain Python.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+try:
+	import numba
+	import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+	numba = None
+	np = None
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _chain_stones_py(grid: bytearray, size: int, start: int) -> List[int]:
+	"""Pure-Python traversal; see the module docstring."""
+	color = grid[start]
+	n = size * size
+	seen = bytearray(n)
+	seen[start] = 1
+	stack = [start]
+	stones: List[int] = []
+	while stack:
+		i = stack.pop()
+		stones.append(i)
+		c = i % size
+		for j in (
+			i - size if i >= size else -1,
+			i + size if i + size < n else -1,
+			i - 1 if c > 0 else -1,
+			i + 1 if c < size - 1 else -1,
+		):
+			if j >= 0 and grid[j] == color and not seen[j]:
+				seen[j] = 1
+				stack.append(j)
+	return stones
+
+
+if NUMBA_AVAILABLE:
+
+	@numba.njit(cache=True)
+	def _chain_stones_kernel(grid, size, start):  # pragma: no cover
+		color = grid[start]
+		n = size * size
+		seen = np.zeros(n, np.uint8)
+		stack = np.empty(n, np.int32)
+		stones = np.empty(n, np.int32)
+		seen[start] = 1
+		stack[0] = start
+		top = 1
+		count = 0
+		while top > 0:
+			top -= 1
+			i = stack[top]
+			stones[count] = i
+			count += 1
+			c = i % size
+			for k in range(4):
+				if k == 0:
+					if i < size:
+						continue
+					j = i - size
+				elif k == 1:
+					if i + size >= n:
+						continue
+					j = i + size
+				elif k == 2:
+					if c == 0:
+						continue
+					j = i - 1
+				else:
+					if c == size - 1:
+						continue
+					j = i + 1
+				if grid[j] == color and seen[j] == 0:
+					seen[j] = 1
+					stack[top] = j
+					top += 1
+		return stones[:count]
+
+	def chain_stones(grid: bytearray, size: int, start: int) -> List[int]:
+		# Numba takes the bytearray as a uint8 buffer directly (no NumPy view)
+		return _chain_stones_kernel(grid, size, start).tolist()
+
+else:
+	chain_stones = _chain_stones_py
@@ -0,0 +1,108 @@
+"""Five-in-a-row test for Gomoku, JIT-compiled with Numba when it is available.
+
+`has_five(grid, size, row, col, color)` counts, along each of the four
+line directions through (row, col), the consecutive cells of `color` on a
+flat row-major board grid (0 = empty, 1 = black, 2 = white) and returns
+True if any line reaches five. Each count stops as soon as it reaches
+five, so at most four cells are read on either side of (row, col).
+
+Numba is optional. When it is not installed a plain-Python version is
+used instead. It walks the same counts over precomputed rays: for each
+cell and direction, the flat indices of the up to four cells on either
+side, already cut off at the board edge (built once per board size). The
+inner loops then index the grid directly, with no coordinate arithmetic
+or bounds checks.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+try:
+	import numba
+except ImportError:  # pragma: no cover - depends on the environment
+	numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+# (dr, dc) for horizontal, vertical and the two diagonals; a module-level
+# constant, so neither the Python scan nor the kernel rebuilds it per call
+# (Numba freezes it into the compiled code)
+_DIRS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+# per board size: for each flat cell index, one (forward, backward) pair
+# of rays per direction, each the flat indices of up to four cells going
+# away from the cell; directions with no room for a five are left out
+_RAYS: Dict[int, Tuple[Tuple[Tuple[Tuple[int, ...], Tuple[int, ...]], ...], ...]] = {}
+
+
+def _rays(size: int) -> Tuple[Tuple[Tuple[Tuple[int, ...], Tuple[int, ...]], ...], ...]:
+	"""Return (building and caching it on first use) the ray table for a
+	size x size board, indexed by flat cell index."""
+	table = _RAYS.get(size)
+	if table is None:
+		cells = []
+		for r in range(size):
+			for c in range(size):
+				per_dir = []
+				for dr, dc in _DIRS:
+					fwd = tuple(
+						(r + k * dr) * size + c + k * dc for k in range(1, 5)
+						if 0 <= r + k * dr < size and 0 <= c + k * dc < size
+					)
+					back = tuple(
+						(r - k * dr) * size + c - k * dc for k in range(1, 5)
+						if 0 <= r - k * dr < size and 0 <= c - k * dc < size
+					)
+					if len(fwd) + len(back) >= 4:
+						per_dir.append((fwd, back))
+				cells.append(tuple(per_dir))
+		table = _RAYS[size] = tuple(cells)
+	return table
+
+
+def _has_five_py(grid: bytearray, size: int, row: int, col: int, color: int) -> bool:
+	"""Pure-Python scan over the precomputed rays; see the module docstring."""
+	table = _RAYS.get(size) or _rays(size)
+	for fwd, back in table[row * size + col]:
+		total = 1
+		for j in fwd:
+			if grid[j] != color:
+				break
+			total += 1
+		for j in back:
+			if grid[j] != color:
+				break
+			total += 1
+		if total >= 5:
+			return True
+	return False
+
+
+if NUMBA_AVAILABLE:
+
+	# Numba types the bytearray grid as a uint8 buffer directly, so the
+	# kernel is called as-is: no wrapper, no per-call NumPy view
+	@numba.njit(cache=True, boundscheck=False)
+	def _has_five_kernel(grid, size, row, col, color):  # pragma: no cover
+		for dr, dc in _DIRS:
+			total = 1
+			r, c = row + dr, col + dc
+			while total < 5 and 0 <= r < size and 0 <= c < size and grid[r * size + c] == color:
+				total += 1
+				r += dr
+				c += dc
+			r, c = row - dr, col - dc
+			while total < 5 and 0 <= r < size and 0 <= c < size and grid[r * size + c] == color:
+				total += 1
+				r -= dr
+				c -= dc
+			if total >= 5:
+				return True
+		return False
+
+	has_five = _has_five_kernel
+
+else:
+	has_five = _has_five_py
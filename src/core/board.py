@@ -7,7 +7,37 @@ piece for the Board abstraction used by board games like Go or Gomoku.
 
 from __future__ import annotations
 
-from typing import Generator, List, Tuple
+import base64
+import binascii
+import random
+import sys
+from enum import IntEnum
+from typing import Dict, FrozenSet, Iterator, Sequence, Tuple
+
+# Canonical (interned) color strings. Every color string handed out by the
+# board is one of these objects, so equality checks against them can
+# short-circuit on identity.
+_EMPTY = sys.intern("empty")
+_BLACK = sys.intern("black")
+_WHITE = sys.intern("white")
+
+# all-empty grid per board size; new boards copy it with one memcpy
+_EMPTY_TEMPLATES: Dict[int, bytes] = {}
+# every (row, col) pair per board size, in row-major order
+_POSITIONS: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+# Zobrist keys per board size: for each cell, one random 64-bit key per
+# cell code, with 0 for empty so only stones contribute to the hash. The
+# fixed seed keeps position hashes reproducible across runs.
+_ZOBRIST_SEED = 0x5A0B
+_ZOBRIST_KEYS: Dict[int, Tuple[Tuple[int, int, int], ...]] = {}
+
+
+class Piece(IntEnum):
+	"""Cell codes stored in the board grid."""
+
+	EMPTY = 0
+	BLACK = 1
+	WHITE = 2
 
 
 class BoardError(Exception):
@@ -25,13 +55,28 @@ class PositionOccupiedError(BoardError, ValueError):
 class Board:
 	"""A simple square board.
 
-	The board stores pieces in a 2D list. Each cell contains one of the
-	following strings: 'empty', 'black', 'white'. Rows and columns are
-	zero-indexed.
+	The board stores pieces in a flat row-major `bytearray` of small int
+	codes (0 = empty, 1 = black, 2 = white); cell (row, col) lives at index
+	``row * size + col``. A Zobrist hash of the position is kept up to date with one XOR per cell
+	change (see `hash`).
+	The public API still speaks in the strings 'empty', 'black' and 'white'.
+	Rows and columns are zero-indexed.
 	"""
 
-	VALID_COLORS = {"black", "white"}
-	EMPTY = "empty"
+	# no per-instance __dict__: the fields below are read on every move
+	__slots__ = ("_size", "_grid", "_zkeys", "_hash")
+
+	VALID_COLORS: FrozenSet[str] = frozenset((_BLACK, _WHITE))
+	EMPTY = _EMPTY
+	# string <-> cell code tables; the strings are only needed at the
+	# public API edge (get_piece, saves, rendering). The codes are plain
+	# ints (`.value`), not Piece members: they are passed on to the Numba
+	# kernels, and Numba types an IntEnum argument on a slow path (tens of
+	# microseconds per call instead of about 0.5 us)
+	_CODE: Dict[str, int] = {
+		_EMPTY: Piece.EMPTY.value, _BLACK: Piece.BLACK.value, _WHITE: Piece.WHITE.value,
+	}
+	_COLOR: Tuple[str, str, str] = (_EMPTY, _BLACK, _WHITE)
 
 	def __init__(self, size: int):
 		"""Create a size x size board.
@@ -44,10 +89,19 @@ class Board:
 		if not isinstance(size, int) or size <= 0:
 			raise ValueError("size must be a positive integer")
 		self._size: int = size
-		# initialize a 2D list of 'empty'
-		self._grid: List[List[str]] = [
-			[self.EMPTY for _ in range(size)] for _ in range(size)
-		]
+		# one byte per cell, all zero (= empty), cloned from a cached template
+		template = _EMPTY_TEMPLATES.get(size)
+		if template is None:
+			template = _EMPTY_TEMPLATES[size] = bytes(size * size)
+		self._grid: bytearray = bytearray(template)
+		keys = _ZOBRIST_KEYS.get(size)
+		if keys is None:
+			rng = random.Random(_ZOBRIST_SEED)
+			keys = _ZOBRIST_KEYS[size] = tuple(
+				(0, rng.getrandbits(64), rng.getrandbits(64)) for _ in range(size * size)
+			)
+		self._zkeys: Tuple[Tuple[int, int, int], ...] = keys
+		self._hash: int = 0
 
 	def get_size(self) -> int:
 		"""Return the board side length (number of rows/cols)."""
@@ -66,8 +120,11 @@ class Board:
 
 		Raises InvalidPositionError for out-of-range coordinates.
 		"""
-		self._validate_position(row, col)
-		return self._grid[row][col]
+		# bounds check inlined: this is the hot public read
+		size = self._size
+		if not (0 <= row < size and 0 <= col < size):
+			raise InvalidPositionError(f"Position ({row}, {col}) is out of bounds")
+		return self._COLOR[self._grid[row * size + col]]
 
 	def place_piece(self, row: int, col: int, color: str) -> None:
 		"""Place a piece of `color` at (row, col). Valid colors: 'black', 'white'.
@@ -79,10 +136,13 @@ class Board:
 		"""
 		self._validate_position(row, col)
 		if color not in self.VALID_COLORS:
-			raise ValueError(f"Invalid color '{color}'. Valid colors: {self.VALID_COLORS}")
-		if self._grid[row][col] != self.EMPTY:
+			raise ValueError(f"Invalid color '{color}'. Valid colors: {sorted(self.VALID_COLORS)}")
+		idx = row * self._size + col
+		if self._grid[idx]:
 			raise PositionOccupiedError(f"Position ({row}, {col}) is already occupied")
-		self._grid[row][col] = color
+		code = self._CODE[color]
+		self._grid[idx] = code
+		self._hash ^= self._zkeys[idx][code]
 
 	def remove_piece(self, row: int, col: int) -> None:
 		"""Remove a piece at (row, col), setting the cell to 'empty'.
@@ -91,26 +151,124 @@ class Board:
 		Raises ValueError if the cell is already empty.
 		"""
 		self._validate_position(row, col)
-		if self._grid[row][col] == self.EMPTY:
+		idx = row * self._size + col
+		code = self._grid[idx]
+		if not code:
 			raise ValueError(f"Cannot remove piece: position ({row}, {col}) is already empty")
-		self._grid[row][col] = self.EMPTY
+		self._grid[idx] = 0
+		self._hash ^= self._zkeys[idx][code]
+
+	def _set_code(self, idx: int, code: int) -> None:
+		"""Internal: write cell code `code` at flat index `idx`, unchecked.
+
+		Every direct write to the grid must go through here (or
+		`_load_codes`) so the hash stays in step.
+		"""
+		old = self._grid[idx]
+		keys = self._zkeys[idx]
+		self._hash ^= keys[old] ^ keys[code]
+		self._grid[idx] = code
+
+	def _load_codes(self, raw: bytes) -> None:
+		"""Internal: replace the whole grid with `raw` (size*size valid codes)."""
+		self._grid[:] = raw
+		h = 0
+		for keys, v in zip(self._zkeys, raw):
+			h ^= keys[v]
+		self._hash = h
+
+	def clear(self) -> None:
+		"""Remove every piece, leaving the board as freshly constructed.
+
+		The grid is refilled in place from the cached empty template; no
+		new board is allocated.
+		"""
+		self._grid[:] = _EMPTY_TEMPLATES[self._size]
+		self._hash = 0
+
+	def hash(self) -> int:
+		"""Return the Zobrist hash of the current position.
 
-	def iter_positions(self) -> Generator[Tuple[int, int], None, None]:
-		"""Yield all board coordinates as (row, col) pairs in row-major order.
+		Equal positions on boards of the same size hash equal, so the value
+		can key a transposition table or a set of seen positions.
+		"""
+		return self._hash
+
+	def restore_from_grid(self, grid: Sequence) -> None:
+		"""Replace the whole board from color strings ('empty'/'black'/'white').
+
+		`grid` is either a list of `size` rows or one flat row-major list of
+		size*size cells. It is checked once as a whole and written in one
+		go, rather than cell by cell through `place_piece`.
+
+		Raises:
+			ValueError: if the shape is wrong or a cell is not a known color.
+		"""
+		size = self._size
+		try:
+			cells = grid
+			if grid and isinstance(grid[0], (list, tuple)):
+				if len(grid) != size or any(len(row) != size for row in grid):
+					raise ValueError("grid does not match the board size")
+				cells = [v for row in grid for v in row]
+			if len(cells) != size * size:
+				raise ValueError("grid does not match the board size")
+			raw = bytes(self._CODE[v] for v in cells)
+		except (KeyError, TypeError) as e:
+			raise ValueError(f"invalid grid data: {e}") from e
+		self._load_codes(raw)
+
+	def _to_b64(self) -> str:
+		"""Internal: the raw cell codes (row-major) as a base64 string."""
+		return base64.b64encode(self._grid).decode("ascii")
+
+	def _load_b64(self, text: str) -> None:
+		"""Internal: replace the whole grid from a `_to_b64` string.
+
+		Raises:
+			ValueError: if `text` is not valid base64 of size*size cell codes.
+		"""
+		try:
+			raw = base64.b64decode(text, validate=True)
+		except (binascii.Error, TypeError) as e:
+			raise ValueError(f"invalid grid data: {e}") from e
+		# every byte must be a known cell code (0/1/2)
+		if len(raw) != len(self._grid) or raw.translate(None, b"\x00\x01\x02"):
+			raise ValueError("invalid grid data")
+		self._load_codes(raw)
+
+	def count(self, color: str) -> int:
+		"""Return how many cells hold `color` ('empty', 'black' or 'white').
+
+		This is a single C-level scan of the grid.
+		"""
+		return self._grid.count(self._CODE[color])
+
+	def iter_positions(self) -> Iterator[Tuple[int, int]]:
+		"""Iterate over all board coordinates as (row, col) pairs in row-major order.
+
+		The pairs come from a tuple built once per board size, so repeated
+		walks allocate nothing per cell.
 
 		Example:
 			for r, c in board.iter_positions():
 				# do something with (r, c)
 		"""
-		for r in range(self._size):
-			for c in range(self._size):
-				yield (r, c)
+		positions = _POSITIONS.get(self._size)
+		if positions is None:
+			size = self._size
+			positions = _POSITIONS[size] = tuple((r, c) for r in range(size) for c in range(size))
+		return iter(positions)
 
 	def __repr__(self) -> str:
 		"""Human-readable representation; useful for debugging and teaching.
 
 		Very small board prints the grid in a compact form.
 		"""
-		rows = [" ".join(self._grid[r]) for r in range(self._size)]
+		size = self._size
+		rows = [
+			" ".join(self._COLOR[v] for v in self._grid[r * size:(r + 1) * size])
+			for r in range(size)
+		]
 		return f"Board(size={self._size})\n" + "\n".join(rows)
 
@@ -8,11 +8,12 @@ optionally `pass_turn`.
 from __future__ import annotations
 
 import abc
+import sys
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional
 
-from src.core.board import Board
+from src.core.board import Board, Piece
 from src.core.player import Player
 
 
@@ -23,14 +24,55 @@ class GameStatus(Enum):
 	DRAW = auto()
 
 
+# ----- history records -----
+# One small slotted record per action; undo dispatches on the record type.
+
+@dataclass(slots=True)
+class MoveRecord:
+	"""A placed piece: the cell, its previous code and the turn state before."""
+
+	row: int
+	col: int
+	prev_value: int
+	prev_status: GameStatus
+	prev_current: Player
+	prev_other: Player
+
+
+@dataclass(slots=True)
+class PassRecord:
+	"""A passed turn; only the turn state needs restoring."""
+
+	prev_status: GameStatus
+	prev_current: Player
+	prev_other: Player
+
+
+@dataclass(slots=True)
+class ResignRecord:
+	"""A resignation; only the turn state needs restoring."""
+
+	prev_status: GameStatus
+	prev_current: Player
+	prev_other: Player
+
+
 class Game(abc.ABC):
 	"""Abstract game base class.
 
 	Subclasses should implement `make_move` and may override `pass_turn`.
 	This base class provides undo via a simple history stack and common
 	helpers for subclasses.
+
+	Instance fields are slotted; subclasses that add fields list them in
+	their own `__slots__`.
 	"""
 
+	__slots__ = (
+		"board", "black_player", "white_player", "current_player", "other_player",
+		"_status", "_over", "_history", "_stones_placed",
+	)
+
 	def __init__(self, board: Board, black_player: Player, white_player: Player):
 		self.board = board
 		self.black_player = black_player
@@ -38,10 +80,24 @@ class Game(abc.ABC):
 		# default: black moves first
 		self.current_player: Player = black_player
 		self.other_player: Player = white_player
-		self.status: GameStatus = GameStatus.ONGOING
-		# history stack for undo: each entry is a dict with enough info
-		# to revert a previous action.
-		self._history: List[Dict[str, Any]] = []
+		# status is a property; setting it also keeps the _over flag in step
+		self._status: GameStatus = GameStatus.ONGOING
+		self._over: bool = False
+		# history stack for undo: each entry is a record (MoveRecord,
+		# PassRecord, ...) with enough info to revert a previous action.
+		self._history: List[object] = []
+		# stones currently on the board, kept in step by _apply_move/undo
+		# (and by subclasses that remove stones) so fullness is O(1)
+		self._stones_placed: int = 0
+
+	@property
+	def status(self) -> GameStatus:
+		return self._status
+
+	@status.setter
+	def status(self, value: GameStatus) -> None:
+		self._status = value
+		self._over = value is not GameStatus.ONGOING
 
 	# ----- basic helpers and template methods -----
 	@abc.abstractmethod
@@ -64,18 +120,10 @@ class Game(abc.ABC):
 		"""Current player resigns; other player wins. History entry is recorded
 		to allow undo.
 		"""
-		previous_status = self.status
-		previous_current = self.current_player
-		previous_other = self.other_player
 		# record resign action so that undo can restore everything
-		self._history.append({
-			"action": "resign",
-			"previous_status": previous_status,
-			"previous_current": previous_current,
-			"previous_other": previous_other,
-		})
+		self._history.append(ResignRecord(self._status, self.current_player, self.other_player))
 		# set status accordingly
-		if self.current_player.color == "black":
+		if self.current_player.color_id == Piece.BLACK:
 			self.status = GameStatus.WHITE_WIN
 		else:
 			self.status = GameStatus.BLACK_WIN
@@ -89,81 +137,152 @@ class Game(abc.ABC):
 		if not self._history:
 			raise ValueError("No actions to undo")
 		entry = self._history.pop()
-		action = entry.get("action")
 		# restore players and status always
-		self.current_player = entry.get("previous_current", self.current_player)
-		self.other_player = entry.get("previous_other", self.other_player)
-		self.status = entry.get("previous_status", self.status)
-
-		if action == "move":
-			row = entry["row"]
-			col = entry["col"]
-			prev = entry["prev_value"]
-			# restore previous value on board
-			# board exposes remove/place; set by direct manipulation
-			# we can use board._grid for performance but avoid it; use API:
-			if prev == Board.EMPTY:
-				# if prev empty, remove piece (set to empty)
-				# but Board.remove_piece will raise if already empty; use direct assign
-				self.board._grid[row][col] = Board.EMPTY
-			else:
-				self.board._grid[row][col] = prev
-		elif action == "pass":
-			# pass had no board changes
-			pass
-		elif action == "resign":
-			# nothing further; status restored above
-			pass
-		else:
-			# unknown action type: ignore
-			pass
+		self.current_player = entry.prev_current
+		self.other_player = entry.prev_other
+		self.status = entry.prev_status
+		handler = self._UNDO_HANDLERS.get(type(entry))
+		if handler is not None:
+			handler(self, entry)
+
+	def _undo_move(self, entry: MoveRecord) -> None:
+		# restore previous value on board by writing the cell directly
+		# (Board.remove_piece would raise on an empty cell)
+		idx = entry.row * self.board.get_size() + entry.col
+		if self.board._grid[idx] and not entry.prev_value:
+			self._stones_placed -= 1
+		self.board._set_code(idx, entry.prev_value)
+
+	def _undo_noop(self, entry: object) -> None:
+		# pass/resign had no board changes; turn state is restored by undo
+		pass
+
+	# record type -> undo handler; subclasses with their own record types
+	# extend this table
+	_UNDO_HANDLERS: ClassVar[Dict[type, Callable[["Game", object], None]]] = {
+		MoveRecord: _undo_move,
+		PassRecord: _undo_noop,
+		ResignRecord: _undo_noop,
+	}
+
+	def reset(self) -> None:
+		"""Return to the starting position: empty board, black to move, no
+		history. The board and containers are reused rather than rebuilt.
+
+		Subclasses with extra per-game counters reset them and call the base
+		version.
+		"""
+		self.board.clear()
+		self.current_player = self.black_player
+		self.other_player = self.white_player
+		self.status = GameStatus.ONGOING
+		self._history.clear()
+		self._sync_from_board()
 
 	def is_over(self) -> bool:
-		return self.status != GameStatus.ONGOING
+		return self._over
 
 	def get_winner(self) -> Optional[Player]:
-		if self.status == GameStatus.BLACK_WIN:
+		# ongoing games (the common case when polled every move) stop at
+		# the cached flag
+		if not self._over:
+			return None
+		status = self._status
+		if status is GameStatus.BLACK_WIN:
 			return self.black_player
-		if self.status == GameStatus.WHITE_WIN:
+		if status is GameStatus.WHITE_WIN:
 			return self.white_player
 		return None
 
+	# ----- persistence -----
+	def to_state_dict(self) -> Dict[str, Any]:
+		"""Return the game state as a JSON-friendly dict.
+
+		The board is stored as base64 of its raw cell codes (row-major).
+		Subclasses extend the dict with their own fields.
+		"""
+		return {
+			"current_color": self.current_player.color,
+			"status": self.status.name,
+			"grid_b64": self.board._to_b64(),
+		}
+
+	def apply_state_dict(self, state: Dict[str, Any]) -> None:
+		"""Restore a state produced by `to_state_dict` onto this new game.
+
+		Also accepts the older 'grid' form: color strings, as a list of rows
+		or one flat list (see `Board.restore_from_grid`).
+
+		Raises:
+			ValueError: if the board data is malformed.
+		"""
+		if "grid_b64" in state:
+			self.board._load_b64(state["grid_b64"])
+		else:
+			self.board.restore_from_grid(state.get("grid"))
+
+		cur_color = state.get("current_color")
+		if isinstance(cur_color, str):
+			# strings parsed from JSON are not interned; make it the shared object
+			cur_color = sys.intern(cur_color)
+		# both sides are canonical interned strings: compare by identity
+		if cur_color is self.black_player.color:
+			self.current_player = self.black_player
+			self.other_player = self.white_player
+		else:
+			self.current_player = self.white_player
+			self.other_player = self.black_player
+
+		try:
+			self.status = GameStatus[state.get("status")]
+		except (KeyError, TypeError):
+			# missing, unknown or not even a string: treat as ongoing
+			self.status = GameStatus.ONGOING
+
+		self._sync_from_board()
+
+	def _sync_from_board(self) -> None:
+		"""Rebuild any state derived from the board after it was written
+		directly (e.g. by `apply_state_dict`). Subclasses extending this
+		must call the base version.
+		"""
+		grid = self.board._grid
+		self._stones_placed = len(grid) - grid.count(0)
+
 	# ----- protected helpers for subclasses -----
-	def _record_move(self, row: int, col: int, prev_value: str) -> None:
+	# record classes used by the helpers below; subclasses that need to
+	# remember more per action swap in a subclass of the record
+	_MOVE_RECORD: ClassVar[type] = MoveRecord
+	_PASS_RECORD: ClassVar[type] = PassRecord
+
+	def _record_move(self, row: int, col: int, prev_value: int) -> None:
 		"""Record a move action into history. Subclasses call this before
 		or after applying a move depending on their semantics.
+
+		`prev_value` is the cell's board code before the move.
 		"""
-		self._history.append({
-			"action": "move",
-			"row": row,
-			"col": col,
-			"prev_value": prev_value,
-			"previous_status": self.status,
-			"previous_current": self.current_player,
-			"previous_other": self.other_player,
-		})
+		self._history.append(self._MOVE_RECORD(
+			row, col, prev_value, self._status, self.current_player, self.other_player,
+		))
 
 	def _apply_move(self, row: int, col: int) -> None:
 		"""Apply a simple move: place a piece for current_player and swap turns.
 
 		This helper uses Board.place_piece and will raise whatever exceptions
-		board raises (e.g., position occupied).
+		board raises (e.g., position occupied); a move that raises leaves no
+		history entry behind.
 		"""
-		prev = self.board.get_piece(row, col)
-		self._record_move(row, col, prev)
 		# place the piece
 		self.board.place_piece(row, col, self.current_player.color)
+		# record only once the placement succeeded; the cell was empty
+		self._record_move(row, col, Piece.EMPTY)
+		self._stones_placed += 1
 		# swap players
 		self._switch_turn()
 
 	def _apply_pass(self) -> None:
 		"""Apply a pass action: swap players and record history entry."""
-		self._history.append({
-			"action": "pass",
-			"previous_status": self.status,
-			"previous_current": self.current_player,
-			"previous_other": self.other_player,
-		})
+		self._history.append(self._PASS_RECORD(self._status, self.current_player, self.other_player))
 		self._switch_turn()
 
 	def _switch_turn(self) -> None:
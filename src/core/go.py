@@ -1,40 +1,90 @@
 """Go game module.
 
-Provides a small `GoGame` subclass with support for passing via `pass_turn`.
-This implementation is intentionally minimal and suitable as a template or
-for basic unit tests; it doesn't implement captures or scoring.
+Provides a `GoGame` subclass with captures, a suicide check, positional
+superko and passing via `pass_turn`. Chains and their liberties are kept
+in a union-find structure so a move is checked without flood-filling the
+board. The game ends after two consecutive passes or when the board is
+full, and is decided by stones on the board plus captured stones (there
+is no territory scoring).
 """
 
 from __future__ import annotations
 
-from src.core.game import Game, GameStatus
-from src.core.board import Board
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.core.game import Game, GameStatus, MoveRecord, PassRecord
+from src.core.board import Board, Piece
+from src.core._go_numba import chain_stones
 from src.core.player import Player
-from typing import List, Set, Tuple
+
+# per board size: for each flat cell index, the tuple of its on-board
+# neighbors' flat indices
+_NEIGHBORS: Dict[int, Tuple[Tuple[int, ...], ...]] = {}
+
+
+@dataclass(slots=True)
+class GoMoveRecord(MoveRecord):
+	"""Move record plus what a Go move changes beyond the placed stone."""
+
+	# (flat index, board code) of every stone this move captured
+	captured: List[Tuple[int, int]] = field(default_factory=list)
+	# (list, index, old value) writes to the chain structure, for rollback
+	chain_journal: List[Tuple[list, int, object]] = field(default_factory=list)
+	prev_captured_black: int = 0
+	prev_captured_white: int = 0
+	prev_consecutive_passes: int = 0
+	# whether the resulting position was added to the superko set
+	new_position: bool = False
+
+
+@dataclass(slots=True)
+class GoPassRecord(PassRecord):
+	"""Pass record plus the pass counter before the pass."""
+
+	prev_consecutive_passes: int = 0
 
 
 class GoGame(Game):
-	"""Tiny Go game subclass.
+	"""Go game: captures, no suicide, positional superko and passing.
 
-	For tests and demo, `make_move` places a stone and `pass_turn` is enabled.
-	The class does not implement capture or scoring; it exists to validate
-	the factory and base game behavior.
+	`make_move` places a stone, removes any opponent chains left without
+	liberties and rejects suicide and moves that repeat an earlier
+	position. Two consecutive passes (or a full board) end the game, won
+	by the side with more stones on the board plus captured stones.
 	"""
 
+	__slots__ = (
+		"_nbrs", "captured_black", "captured_white", "_consecutive_passes",
+		"_parent", "_rank", "_liberties", "_seen_positions",
+	)
+
 	def __init__(self, size: int, black_player: Player, white_player: Player):
 		board = Board(size)
 		super().__init__(board, black_player, white_player)
+		# flat neighbor indices of every cell, shared by all games of this size
+		self._nbrs: Tuple[Tuple[int, ...], ...] = self._build_neighbors(size)
 		# number of stones captured (stones taken off the board) by each side
 		self.captured_black: int = 0
 		self.captured_white: int = 0
 		# consecutive passes count; two consecutive passes ends the game
 		self._consecutive_passes: int = 0
+		# union-find over stones: each chain has a root cell that owns the
+		# chain's liberty set, so captures and suicide are decided without
+		# flood-filling. Entries of empty cells are stale and ignored.
+		self._parent: List[int] = list(range(size * size))
+		self._rank: List[int] = [0] * (size * size)
+		self._liberties: List[Optional[Set[int]]] = [None] * (size * size)
+		# hash (Board.hash) of every position reached so far, to enforce
+		# positional superko
+		self._seen_positions: Set[int] = {board.hash()}
 
 	def make_move(self, row: int, col: int) -> None:
-		if self.is_over():
+		if self._over:
 			raise ValueError("Game is already over")
 
-		if self.board.get_piece(row, col) != self.board.EMPTY:
+		# get_piece returns the canonical color strings, so identity suffices
+		if self.board.get_piece(row, col) is not Board.EMPTY:
 			raise ValueError("Position already occupied")
 
 		# record current captured counts and consecutive passes for undo
@@ -46,83 +96,120 @@ class GoGame(Game):
 		self._apply_move(row, col)
 
 		# mover is the player that just moved (other_player because _apply_move switched)
-		mover_color = self.other_player.color
-		opponent_color = self.current_player.color
-
-		# perform captures: any adjacent opponent chains without liberties
-		captured_positions: List[Tuple[int, int, str]] = []
-		processed_positions: Set[Tuple[int, int]] = set()
-		for nr, nc in self._neighbors(row, col):
-			if self.board.get_piece(nr, nc) == opponent_color:
-				chain = self._find_chain(nr, nc)
-				if not self._chain_has_liberties(chain):
-					# Skip chains we've already captured from a different neighbor
-					if any(pos in processed_positions for pos in chain):
-						continue
-					# capture the entire chain
-					for (r, c) in chain:
-						captured_positions.append((r, c, opponent_color))
-						# remove from board
-						self.board._grid[r][c] = self.board.EMPTY
-					processed_positions.update(chain)
-					# increment captured counters for mover
-					if opponent_color == "black":
-						self.captured_white += len(chain)
-					else:
-						self.captured_black += len(chain)
+		mover_code = self.other_player.color_id
+		opponent_code = self.current_player.color_id
+
+		grid = self.board._grid
+		idx = row * self.board.get_size() + col
+		# (list, index, old value) triples so undo can roll the chain
+		# structure back exactly
+		journal: List[Tuple[list, int, object]] = []
+		# hot loops below: bind attribute/method lookups to locals once
+		nbrs = self._nbrs
+		find = self._find
+		liberties = self._liberties
+		journal_set = self._journal_set
+		set_code = self.board._set_code
+
+		# group the up-to-4 neighbors by chain root once, before anything
+		# changes, so each adjacent chain is handled exactly once below
+		own_roots: List[int] = []
+		opp_roots: List[int] = []
+		for n in nbrs[idx]:
+			v = grid[n]
+			if v == mover_code:
+				r = find(n)
+				if r not in own_roots:
+					own_roots.append(r)
+			elif v == opponent_code:
+				r = find(n)
+				if r not in opp_roots:
+					opp_roots.append(r)
+
+		# the new stone starts as its own chain; merge it with friendly neighbors
+		journal_set(journal, self._parent, idx, idx)
+		journal_set(journal, self._rank, idx, 0)
+		journal_set(journal, liberties, idx, {n for n in nbrs[idx] if not grid[n]})
+		root = idx
+		for r in own_roots:
+			root = self._union(journal, root, r)
+		if own_roots:
+			journal_set(journal, liberties, root, liberties[root] - {idx})
+
+		# the new stone takes a liberty from each adjacent opponent chain;
+		# any chain left without liberties is captured
+		captured_positions: List[Tuple[int, int]] = []
+		for opp_root in opp_roots:
+			libs = liberties[opp_root] - {idx}
+			journal_set(journal, liberties, opp_root, libs)
+			if libs:
+				continue
+			chain = self._find_chain(opp_root)
+			for i in chain:
+				captured_positions.append((i, opponent_code))
+				# remove from board
+				set_code(i, 0)
+			# freed cells become liberties of the mover's adjacent chains
+			for i in chain:
+				for m in nbrs[i]:
+					if grid[m] == mover_code:
+						r = find(m)
+						if i not in liberties[r]:
+							journal_set(journal, liberties, r, liberties[r] | {i})
+			self._stones_placed -= len(chain)
+			# increment captured counters for mover
+			if opponent_code == Piece.BLACK:
+				self.captured_white += len(chain)
+			else:
+				self.captured_black += len(chain)
 
 		# augment history entry with captured information and previous counts
 		last = self._history[-1]
-		last["captured"] = captured_positions
-		last["prev_captured_black"] = prev_captured_black
-		last["prev_captured_white"] = prev_captured_white
-		last["prev_consecutive_passes"] = prev_consecutive_passes
+		last.captured = captured_positions
+		last.chain_journal = journal
+		last.prev_captured_black = prev_captured_black
+		last.prev_captured_white = prev_captured_white
+		last.prev_consecutive_passes = prev_consecutive_passes
 
 		# if capture occurred, consecutive passes reset to 0; otherwise also reset because it's a move
 		self._consecutive_passes = 0
 
 		# if no captured positions and mover's chain has no liberties -> suicide
-		# find chain of the placed stone (mover_color)
-		mover_chain = self._find_chain(row, col)
-		if not self._chain_has_liberties(mover_chain) and not captured_positions:
+		if not liberties[find(idx)] and not captured_positions:
 			# undo the move and raise
 			self.undo()
 			raise ValueError("Suicide is not allowed")
 
+		# positional superko: the resulting position must be new
+		position = self.board.hash()
+		if position in self._seen_positions:
+			self.undo()
+			raise ValueError("Ko: move would repeat a previous position")
+		self._seen_positions.add(position)
+		last.new_position = True
+
 		# if board is full -> end by counting
-		if not any(
-			self.board.get_piece(r, c) == self.board.EMPTY
-			for r in range(self.board.get_size())
-			for c in range(self.board.get_size())
-		):
+		if self._stones_placed == len(grid):
 			self._end_game_by_counts()
 
 	def pass_turn(self) -> None:
-		if self.is_over():
+		if self._over:
 			raise ValueError("Game is already over")
 		prev_consecutive = self._consecutive_passes
 		self._apply_pass()
 		self._consecutive_passes += 1
 		# record previous consecutive passes for undo
-		self._history[-1]["prev_consecutive_passes"] = prev_consecutive
+		self._history[-1].prev_consecutive_passes = prev_consecutive
 		# if both players have passed consecutively, end game
 		if self._consecutive_passes >= 2:
 			self._end_game_by_counts()
 
 	def _end_game_by_counts(self) -> None:
 		"""Determine winner by counting stones on board + captured stones."""
-		black_on_board = 0
-		white_on_board = 0
-		size = self.board.get_size()
-		for r in range(size):
-			for c in range(size):
-				v = self.board.get_piece(r, c)
-				if v == "black":
-					black_on_board += 1
-				elif v == "white":
-					white_on_board += 1
-		black_total = black_on_board + self.captured_black
-		white_total = white_on_board + self.captured_white
+		# called once per game: counting the grid here is cheaper than
+		# keeping per-color tallies up to date on every move
+		black_total = self.board.count("black") + self.captured_black
+		white_total = self.board.count("white") + self.captured_white
 		if black_total > white_total:
 			self.status = GameStatus.BLACK_WIN
 		elif white_total > black_total:
@@ -130,72 +217,147 @@ class GoGame(Game):
 		else:
 			self.status = GameStatus.DRAW
 
-	def _neighbors(self, row: int, col: int) -> List[Tuple[int, int]]:
-		size = self.board.get_size()
-		res: List[Tuple[int, int]] = []
-		for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-			r, c = row + dr, col + dc
-			if 0 <= r < size and 0 <= c < size:
-				res.append((r, c))
-		return res
-
-	def _find_chain(self, row: int, col: int) -> Set[Tuple[int, int]]:
-		"""Return a set of coordinates belonging to a chain connected to (row,col)."""
-		color = self.board.get_piece(row, col)
-		if color == self.board.EMPTY:
-			return set()
-		size = self.board.get_size()
-		stack = [(row, col)]
-		visited: Set[Tuple[int, int]] = set()
-		while stack:
-			r, c = stack.pop()
-			if (r, c) in visited:
-				continue
-			visited.add((r, c))
-			for nr, nc in self._neighbors(r, c):
-				if self.board.get_piece(nr, nc) == color and (nr, nc) not in visited:
-					stack.append((nr, nc))
-		return visited
-
-	def _chain_has_liberties(self, chain: Set[Tuple[int, int]]) -> bool:
-		for (r, c) in chain:
-			for nr, nc in self._neighbors(r, c):
-				if self.board.get_piece(nr, nc) == self.board.EMPTY:
-					return True
-		return False
-
-	def undo(self) -> None:
+	def to_state_dict(self) -> Dict[str, Any]:
+		state = super().to_state_dict()
+		state["captured_black"] = self.captured_black
+		state["captured_white"] = self.captured_white
+		state["consecutive_passes"] = self._consecutive_passes
+		return state
+
+	def apply_state_dict(self, state: Dict[str, Any]) -> None:
+		self.captured_black = int(state.get("captured_black", 0))
+		self.captured_white = int(state.get("captured_white", 0))
+		self._consecutive_passes = int(state.get("consecutive_passes", 0))
+		super().apply_state_dict(state)
+
+	def reset(self) -> None:
+		self.captured_black = 0
+		self.captured_white = 0
+		self._consecutive_passes = 0
+		super().reset()
+
+	def _sync_from_board(self) -> None:
+		"""Rebuild the stone count, chain structure and superko history from the board.
+
+		Callers that write the board directly (e.g. loading a saved game)
+		must call this afterwards.
+		"""
+		super()._sync_from_board()
+		grid = self.board._grid
+		# nothing to journal: the history does not reach past a rebuild
+		journal: List[Tuple[list, int, object]] = []
+		nbrs = self._nbrs
+		find = self._find
+		union = self._union
+		liberties = self._liberties
+		self._parent[:] = range(len(grid))
+		self._rank[:] = [0] * len(grid)
+		liberties[:] = [None] * len(grid)
+		for i, v in enumerate(grid):
+			if v:
+				liberties[i] = set()
+				for n in nbrs[i]:
+					if n < i and grid[n] == v:
+						union(journal, find(i), find(n))
+		for i, v in enumerate(grid):
+			if v:
+				libs = liberties[find(i)]
+				libs.update(n for n in nbrs[i] if not grid[n])
+		# earlier positions are unknown so superko restarts here
+		self._seen_positions = {self.board.hash()}
+
+	@staticmethod
+	def _journal_set(journal: List[Tuple[list, int, object]], lst: list, i: int, value: object) -> None:
+		"""Set lst[i] = value, remembering the old value in `journal` for undo."""
+		journal.append((lst, i, lst[i]))
+		lst[i] = value
+
+	def _find(self, idx: int) -> int:
+		"""Return the root cell of the chain containing stone `idx`."""
+		parent = self._parent
+		while parent[idx] != idx:
+			idx = parent[idx]
+		return idx
+
+	def _union(self, journal: List[Tuple[list, int, object]], a: int, b: int) -> int:
+		"""Merge the chains rooted at `a` and `b` (union by rank); return the new root.
+
+		There is no path compression so every change is a journaled slot
+		write that undo can revert.
+		"""
+		if a == b:
+			return a
+		rank = self._rank
+		liberties = self._liberties
+		if rank[a] < rank[b]:
+			a, b = b, a
+		self._journal_set(journal, self._parent, b, a)
+		if rank[a] == rank[b]:
+			self._journal_set(journal, rank, a, rank[a] + 1)
+		self._journal_set(journal, liberties, a, liberties[a] | liberties[b])
+		return a
+
+	@staticmethod
+	def _build_neighbors(size: int) -> Tuple[Tuple[int, ...], ...]:
+		"""Return, for each flat cell index, the tuple of its on-board neighbors.
+
+		The table is built on first use for each board size and cached.
+		"""
+		table = _NEIGHBORS.get(size)
+		if table is None:
+			rows: List[Tuple[int, ...]] = []
+			for r in range(size):
+				for c in range(size):
+					res: List[int] = []
+					for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+						r2, c2 = r + dr, c + dc
+						if 0 <= r2 < size and 0 <= c2 < size:
+							res.append(r2 * size + c2)
+					rows.append(tuple(res))
+			table = _NEIGHBORS[size] = tuple(rows)
+		return table
+
+	def _find_chain(self, idx: int) -> List[int]:
+		"""Return the flat indices of the chain connected to cell `idx`.
+
+		The flood fill runs in the (optionally Numba-compiled) kernel.
+		"""
+		grid = self.board._grid
+		if not grid[idx]:
+			return []
+		return chain_stones(grid, self.board.get_size(), idx)
+
+	# Go-specific history records and their undo handlers
+	_MOVE_RECORD = GoMoveRecord
+	_PASS_RECORD = GoPassRecord
+
+	def _undo_move(self, entry: GoMoveRecord) -> None:
 		"""Undo with Go-specific restoration of captured stones and counters."""
-		if not self._history:
-			raise ValueError("No actions to undo")
-		entry = self._history.pop()
-		action = entry.get("action")
-		# restore players and status
-		self.current_player = entry.get("previous_current", self.current_player)
-		self.other_player = entry.get("previous_other", self.other_player)
-		self.status = entry.get("previous_status", self.status)
-		if action == "move":
-			row = entry["row"]
-			col = entry["col"]
-			prev = entry["prev_value"]
-			# restore position
-			if prev == self.board.EMPTY:
-				self.board._grid[row][col] = self.board.EMPTY
-			else:
-				self.board._grid[row][col] = prev
-			# restore captured stones and counters
-			captured = entry.get("captured", [])
-			for r, c, color in captured:
-				self.board._grid[r][c] = color
-			self.captured_black = entry.get("prev_captured_black", self.captured_black)
-			self.captured_white = entry.get("prev_captured_white", self.captured_white)
-			self._consecutive_passes = entry.get("prev_consecutive_passes", self._consecutive_passes)
-		elif action == "pass":
-			# restore consecutive passes
-			self._consecutive_passes = entry.get("prev_consecutive_passes", self._consecutive_passes)
-		elif action == "resign":
-			# nothing else
-			pass
-		else:
-			pass
+		# forget the position this move created (the board still holds it)
+		if entry.new_position:
+			self._seen_positions.discard(self.board.hash())
+		# restore position
+		Game._undo_move(self, entry)
+		# the mover is current_player again after the restore in undo()
+		# restore captured stones and counters
+		set_code = self.board._set_code
+		captured = entry.captured
+		for i, code in captured:
+			set_code(i, code)
+		# roll the chain structure back to its state before the move
+		for lst, i, old in reversed(entry.chain_journal):
+			lst[i] = old
+		self._stones_placed += len(captured)
+		self.captured_black = entry.prev_captured_black
+		self.captured_white = entry.prev_captured_white
+		self._consecutive_passes = entry.prev_consecutive_passes
+
+	def _undo_pass(self, entry: GoPassRecord) -> None:
+		# restore consecutive passes
+		self._consecutive_passes = entry.prev_consecutive_passes
 
+	_UNDO_HANDLERS = {
+		**Game._UNDO_HANDLERS,
+		GoMoveRecord: _undo_move,
+		GoPassRecord: _undo_pass,
+	}
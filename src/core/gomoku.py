@@ -1,19 +1,48 @@
 """Gomoku (Five-in-a-Row) game module.
 
 Provides a minimal `GomokuGame` implementation deriving from `Game`.
-This implementation is intentionally simple: it uses the base class helpers
-to place moves and does not implement win detection. It is suitable as a
-starting point and for the factory tests.
+It uses the base class helpers to place moves, checks for a five through
+the last move with `_gomoku_numba.has_five`, and detects a draw from the
+stone count.
 """
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
-from src.core.board import Board
+from src.core.board import Board, Piece
+from src.core._gomoku_numba import has_five
 from src.core.game import Game, GameStatus
 from src.core.player import Player
 
+# cell code -> ASCII '0'/'1' marking one color's cells, to turn the grid
+# into that color's bitboard
+_BIT_TABLES = (
+	None,
+	bytes.maketrans(b"\x00\x01\x02", b"010"),
+	bytes.maketrans(b"\x00\x01\x02", b"001"),
+)
+# per board size: (bit shift, start mask) for each line direction. The
+# shift steps one cell along the direction in the row-major bitboard; the
+# mask has a bit for every cell whose five-cell line in that direction
+# stays on the board, so shifted bits never wrap across a row edge.
+_FIVE_MASKS: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+
+
+def _five_masks(size: int) -> Tuple[Tuple[int, int], ...]:
+	masks = _FIVE_MASKS.get(size)
+	if masks is None:
+		out = []
+		for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+			mask = 0
+			for r in range(size):
+				for c in range(size):
+					if 0 <= r + 4 * dr < size and 0 <= c + 4 * dc < size:
+						mask |= 1 << (r * size + c)
+			out.append((dr * size + dc, mask))
+		masks = _FIVE_MASKS[size] = tuple(out)
+	return masks
+
 
 class GomokuGame(Game):
 	"""Gomoku game with simple five-in-a-row detection.
@@ -24,6 +53,9 @@ class GomokuGame(Game):
 	produces a five-in-a-row for the player who moved.
 	"""
 
+	# no state beyond Game's slots
+	__slots__ = ()
+
 	def __init__(self, size: int, black_player: Player, white_player: Player):
 		if not isinstance(size, int) or size <= 0:
 			raise ValueError("size must be a positive integer")
@@ -31,48 +63,72 @@ class GomokuGame(Game):
 		super().__init__(board, black_player, white_player)
 
 	def make_move(self, row: int, col: int) -> None:
-		if self.is_over():
+		if self._over:
 			raise ValueError("Game is already over")
 		# apply the move via base helper (records history and switches turns)
 		self._apply_move(row, col)
 		# the player who just moved is other_player after the swap
-		mover_color = self.other_player.color
-		if self._has_five_in_a_row(row, col, mover_color):
+		mover_id = self.other_player.color_id
+		# a five needs five of the mover's stones, so at least nine in all
+		if self._stones_placed >= 9 and self._has_five_in_a_row(row, col, mover_id):
 			self.status = (
-				GameStatus.BLACK_WIN if mover_color == "black" else GameStatus.WHITE_WIN
+				GameStatus.BLACK_WIN if mover_id == Piece.BLACK else GameStatus.WHITE_WIN
 			)
 			return
 		# check draw: board full
-		if all(
-			self.board.get_piece(r, c) != self.board.EMPTY
-			for r in range(self.board.get_size())
-			for c in range(self.board.get_size())
-		):
+		size = self.board.get_size()
+		if self._stones_placed == size * size:
 			self.status = GameStatus.DRAW
 
-	def _has_five_in_a_row(self, row: int, col: int, color: str) -> bool:
-		"""Return True if a five-in-a-row exists through (row, col) for color.
+	def apply_state_dict(self, state: Dict[str, Any]) -> None:
+		"""Restore a saved state, rejecting one that is not a real position.
 
-		We check four directions: horizontal, vertical, and two diagonals
-		by counting consecutive cells of the same color in both directions.
+		Raises:
+			ValueError: if the board data is malformed, the stone counts
+				and side to move could not come from alternating play, or
+				the game is saved as ongoing although a five is already on
+				the board.
 		"""
-		size = self.board.get_size()
+		super().apply_state_dict(state)
+		# black opens, so black has as many stones as white (black to move)
+		# or one more (white to move); `make_move` relies on this when it
+		# skips the five check on the first eight stones
+		lead = self.board.count("black") - self.board.count("white")
+		if lead != (self.current_player is self.white_player):
+			raise ValueError("invalid game state: stone counts do not match the side to move")
+		if not self._over and (self.has_five_anywhere("black") or self.has_five_anywhere("white")):
+			raise ValueError("invalid game state: ongoing game already has five in a row")
 
-		def count_in_dir(dr: int, dc: int) -> int:
-			r, c = row + dr, col + dc
-			count = 0
-			while 0 <= r < size and 0 <= c < size and self.board.get_piece(r, c) == color:
-				count += 1
-				r += dr
-				c += dc
-			return count
-
-		# directions: (dr,dc) pairs - we will count both directions for each
-		directions: Tuple[Tuple[int, int], ...] = ((0, 1), (1, 0), (1, 1), (1, -1))
-		for dr, dc in directions:
-			total = 1 + count_in_dir(dr, dc) + count_in_dir(-dr, -dc)
-			if total >= 5:
+	def has_five_anywhere(self, color: str) -> bool:
+		"""Return True if `color` ('black' or 'white') has five in a row
+		anywhere on the board.
+
+		`make_move` only checks the lines through the last move. This
+		checks the whole board at once, for positions that were not
+		reached move by move (set up directly, loaded, or evaluated in
+		bulk). It builds the color's bitboard from the grid (bit
+		``row * size + col`` set for each of its stones); a five starts at
+		every cell that survives ANDing the bitboard with itself shifted
+		one to four steps along a direction.
+		"""
+		# one '0'/'1' digit per cell; reversed so cell 0 is the low bit
+		bits = int(self.board._grid.translate(_BIT_TABLES[Board._CODE[color]])[::-1], 2)
+		for shift, mask in _five_masks(self.board.get_size()):
+			# runs of two, then four, then five
+			run = bits & (bits >> shift)
+			run &= run >> (2 * shift)
+			run &= bits >> (4 * shift)
+			if run & mask:
 				return True
 		return False
 
+	def _has_five_in_a_row(self, row: int, col: int, color_id: int) -> bool:
+		"""Return True if a five-in-a-row exists through (row, col) for the
+		color with cell code `color_id`.
+
+		The four-direction scan runs in the (optionally Numba-compiled)
+		`has_five` kernel on the board's flat grid.
+		"""
+		return has_five(self.board._grid, self.board.get_size(), row, col, color_id)
+
 
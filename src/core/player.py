@@ -7,29 +7,43 @@ string representation suitable for teaching and debugging.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import ClassVar
+from dataclasses import dataclass, field
+from typing import ClassVar, FrozenSet
 
+from src.core.board import Board
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Player:
 	"""Simple player representation.
 
+	Players are immutable (and so hashable) and slotted: their fields are
+	read on every move, and slot access skips the instance `__dict__`.
+
 	Attributes:
 		name: The player's display name
 		color: Either 'black' or 'white'
+		color_id: The board cell code for `color` (derived, see `Piece`)
 	"""
 
-	VALID_COLORS: ClassVar[set] = {"black", "white"}
+	# the board's own (frozen) set, so the two cannot drift apart
+	VALID_COLORS: ClassVar[FrozenSet[str]] = Board.VALID_COLORS
 
 	name: str
 	color: str
+	color_id: int = field(init=False, repr=False, compare=False)
 
 	def __post_init__(self) -> None:
 		if not isinstance(self.name, str) or not self.name:
 			raise ValueError("name must be a non-empty string")
 		if self.color not in self.VALID_COLORS:
-			raise ValueError(f"color must be one of {self.VALID_COLORS}")
+			raise ValueError(f"color must be one of {sorted(self.VALID_COLORS)}")
+		# frozen: set fields through object.__setattr__. The color is
+		# swapped for the board's canonical (interned) string, so color
+		# checks elsewhere can compare by identity.
+		code = Board._CODE[self.color]
+		object.__setattr__(self, "color", Board._COLOR[code])
+		object.__setattr__(self, "color_id", code)
 
 	def __str__(self) -> str:
 		"""Return a compact human-friendly representation.
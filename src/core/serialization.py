@@ -4,12 +4,21 @@ Provides save_game and load_game using JSON. The format is intentionally
 simple and stores:
  - game_type: "gomoku" or "go"
  - size: board size
- - grid: 2D array of strings ('empty'/'black'/'white')
+ - version: format version (3; files without it are version 1)
+ - grid_b64: base64 of the board's raw cell codes (0 empty, 1 black,
+   2 white), one byte per cell in row-major order. Older files store
+   'grid' instead: a flat row-major array of 'empty'/'black'/'white'
+   strings (version 2) or a 2D array of them (version 1)
  - current_color: which color should play next ('black' or 'white')
+ - black_name / white_name: the players' names
  - optional: status and Go-specific captured counters and consecutive passes
 
-These helpers are designed to be easy to read and call from the
-command-line client.
+Everything but the header (game_type, size, version, names) comes from
+`Game.to_state_dict` and is read back by `Game.apply_state_dict`, all in
+one flat object. Both the console and the GUI client save and load
+through these helpers, so either can open the other's files. When
+`orjson` is installed it is used for encoding and decoding; otherwise the
+stdlib `json` module is.
 """
 
 from __future__ import annotations
@@ -18,105 +27,80 @@ import json
 import os
 from typing import Any
 
-from src.core.factory import GameFactory
-from src.core.game import Game, GameStatus
-from src.core.board import Board
-from src.core.go import GoGame
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
+from src.core.factory import GameFactory
+from src.core.game import Game
 
-def save_game(game: Game, filename: str) -> None:
-    """Save minimal game state to `filename` in JSON.
 
-    The saved data includes game type, size, grid and which color moves next.
-    For Go games we also save captured counts and consecutive passes when
-    available.
-    """
-    data: dict[str, Any] = {}
-    # Try to infer game type from class name or instance
-    game_type = getattr(game, "__class__", None).__name__.lower()
+def game_type_of(game: Game) -> str:
+    """Return the factory name ('gomoku' or 'go') of `game`'s type."""
+    # infer game type from the class name
+    game_type = type(game).__name__.lower()
     # normalize to expected tokens
     if "gomoku" in game_type:
-        data["game_type"] = "gomoku"
-    elif "go" in game_type:
-        data["game_type"] = "go"
-    else:
-        # fallback: require GameFactory compatibility; try attribute
-        data["game_type"] = getattr(game, "game_type", "unknown")
+        return "gomoku"
+    if "go" in game_type:
+        return "go"
+    # fallback: require GameFactory compatibility; try attribute
+    return getattr(game, "game_type", "unknown")
 
-    size = game.board.get_size()
-    data["size"] = size
-    data["current_color"] = game.current_player.color
-    data["status"] = getattr(game, "status", GameStatus.ONGOING).name
 
-    # grid
-    grid = [[game.board.get_piece(r, c) for c in range(size)] for r in range(size)]
-    data["grid"] = grid
+def save_game(game: Game, filename: str) -> None:
+    """Save the game state to `filename` in JSON.
 
-    # Go-specific fields
-    if isinstance(game, GoGame):
-        data["captured_black"] = getattr(game, "captured_black", 0)
-        data["captured_white"] = getattr(game, "captured_white", 0)
-        data["consecutive_passes"] = getattr(game, "_consecutive_passes", 0)
+    The file holds the game type, size, format version and player names,
+    followed by the fields of `game.to_state_dict()` (board, turn, status
+    and game-specific counters).
+    """
+    data: dict[str, Any] = {
+        "game_type": game_type_of(game),
+        "size": game.board.get_size(),
+        "version": 3,
+        "black_name": game.black_player.name,
+        "white_name": game.white_player.name,
+    }
+    data.update(game.to_state_dict())
 
     # write file
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
 
 def load_game(filename: str, factory: GameFactory) -> Game:
     """Load a game from `filename` and return a Game instance created by factory.
 
     The factory is used to create the right Game subclass; after creation the
-    board and current player are restored according to the file. Raises
-    FileNotFoundError or ValueError on invalid input.
+    game restores the board, turn and status from the file through
+    `Game.apply_state_dict`. Raises FileNotFoundError or ValueError on
+    invalid input.
     """
     if not os.path.exists(filename):
         raise FileNotFoundError(filename)
 
-    with open(filename, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open(filename, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(filename, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
     game_type = data.get("game_type")
     size = data.get("size")
-    grid = data.get("grid")
-    cur_color = data.get("current_color")
-    status_name = data.get("status")
-
     if game_type not in ("gomoku", "go"):
         raise ValueError("unsupported game_type in file")
-    if not isinstance(size, int) or not isinstance(grid, list):
-        raise ValueError("invalid size or grid in file")
+    if not isinstance(size, int):
+        raise ValueError("invalid size in file")
 
-    # create new game using factory
+    # create new game using factory, then let it restore its own state
+    # (board in either grid form, turn, status and game-specific fields)
     game = factory.create_game(game_type, size)
-
-    # restore board
-    for r in range(size):
-        for c in range(size):
-            val = grid[r][c]
-            if val == Board.EMPTY:
-                continue
-            # place_piece should succeed because new board is empty
-            game.board.place_piece(r, c, val)
-
-    # restore current player
-    if cur_color == game.black_player.color:
-        game.current_player = game.black_player
-        game.other_player = game.white_player
-    else:
-        game.current_player = game.white_player
-        game.other_player = game.black_player
-
-    # restore status if present
-    try:
-        game.status = GameStatus[status_name]
-    except Exception:
-        game.status = GameStatus.ONGOING
-
-    # restore Go-specific data if present
-    if isinstance(game, GoGame):
-        game.captured_black = int(data.get("captured_black", 0))
-        game.captured_white = int(data.get("captured_white", 0))
-        game._consecutive_passes = int(data.get("consecutive_passes", 0))
-
+    game.apply_state_dict(data)
     return game
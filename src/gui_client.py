@@ -12,8 +12,9 @@ import json
 import os
 import tkinter as tk
 from tkinter import messagebox, filedialog, simpledialog
-from typing import Optional
+from typing import List, Optional
 
+from src.core.board import Piece
 from src.core.factory import GameFactory
 from src.core.serialization import save_game, load_game
 
@@ -31,6 +32,15 @@ class GUIClient:
         self.canvas = None
         self.cell_size = 40
         self.board_size = 9
+        # cell code -> (text, font, fill), rebuilt only when cell_size changes
+        self._glyphs: list = []
+        self._build_glyphs()
+        # canvas item id of each cell's glyph (flat row-major index) and the
+        # grid as last drawn; lets a move update only the cells that changed
+        self._cell_items: List[int] = []
+        self._shown_grid: Optional[bytes] = None
+        # pending `after` id of a resize redraw (see _schedule_redraw)
+        self._redraw_after: Optional[str] = None
 
         self._build_menu()
         self._build_status()
@@ -65,6 +75,26 @@ class GUIClient:
         self.canvas = tk.Canvas(frame, width=600, height=600, bg="#f5f5dc")
         self.canvas.pack(expand=True, fill=tk.BOTH)
         self.canvas.bind("<Button-1>", self._on_canvas_click)
+        self.canvas.bind("<Configure>", self._schedule_redraw)
+
+    def _schedule_redraw(self, event=None) -> None:
+        # 拖动窗口时 Tk 会连续触发 <Configure>；只在最后一次事件 50ms 后重绘一次
+        if self._redraw_after is not None:
+            self.root.after_cancel(self._redraw_after)
+        self._redraw_after = self.root.after(50, self._redraw_after_resize)
+
+    def _redraw_after_resize(self) -> None:
+        self._redraw_after = None
+        if not self.game:
+            return
+        # 按画布实际大小缩放格子；大小不变时已有的画布元素仍然有效
+        side = min(self.canvas.winfo_width(), self.canvas.winfo_height())
+        cell_size = max(24, min(60, side // max(1, self.board_size)))
+        if cell_size == self.cell_size:
+            return
+        self.cell_size = cell_size
+        self._build_glyphs()
+        self._draw_board()
 
     def _build_controls(self) -> None:
         frame = tk.Frame(self.root)
@@ -123,34 +153,68 @@ class GUIClient:
         self.cell_size = max(24, min(60, max_pixels // max(1, self.board_size)))
         canvas_size = self.cell_size * self.board_size
         self.canvas.config(width=canvas_size, height=canvas_size)
+        self._build_glyphs()
+
+    def _build_glyphs(self) -> None:
+        # 棋子编码 -> (字符, 字体, 颜色)；空位用小点表示。字体元组只在格子大小变化时创建
+        cs = self.cell_size
+        font_big = ("Arial", cs // 2)
+        glyphs = [None] * 3
+        glyphs[Piece.EMPTY] = ("·", ("Arial", max(8, cs // 3)), "#888")
+        glyphs[Piece.BLACK] = ("●", font_big, "black")
+        glyphs[Piece.WHITE] = ("○", font_big, "black")
+        self._glyphs = glyphs
 
     def _draw_board(self) -> None:
         if not self.game:
             return
         b = self.game.board
         n = b.get_size()
-        self.canvas.delete("all")
+        grid = b._grid
+        cs = self.cell_size
+        half = cs // 2
+        canvas = self.canvas
+        create_text = canvas.create_text
+        canvas.delete("all")
 
         # 画格子
         for i in range(n + 1):
-            x = i * self.cell_size
-            self.canvas.create_line(x, 0, x, n * self.cell_size, fill="#444")
-            y = i * self.cell_size
-            self.canvas.create_line(0, y, n * self.cell_size, y, fill="#444")
+            x = i * cs
+            canvas.create_line(x, 0, x, n * cs, fill="#444")
+            y = i * cs
+            canvas.create_line(0, y, n * cs, y, fill="#444")
 
         # 画棋子
+        glyphs = self._glyphs
+        items = []
         for r in range(n):
+            cy = r * cs + half
+            row_start = r * n
             for c in range(n):
-                piece = b.get_piece(r, c)
-                cx = c * self.cell_size + self.cell_size // 2
-                cy = r * self.cell_size + self.cell_size // 2
-                if piece == "black":
-                    self.canvas.create_text(cx, cy, text="●", font=("Arial", self.cell_size // 2), fill="black")
-                elif piece == "white":
-                    self.canvas.create_text(cx, cy, text="○", font=("Arial", self.cell_size // 2), fill="black")
-                else:
-                    # 空位用小点表示
-                    self.canvas.create_text(cx, cy, text="·", font=("Arial", max(8, self.cell_size // 3)), fill="#888")
+                text, font, fill = glyphs[grid[row_start + c]]
+                items.append(create_text(c * cs + half, cy, text=text, font=font, fill=fill))
+        self._cell_items = items
+        self._shown_grid = bytes(grid)
+
+    def _refresh_cells(self) -> None:
+        """只更新自上次绘制以来发生变化的格子（落子、提子、悔棋）。"""
+        if not self.game:
+            return
+        grid = self.game.board._grid
+        shown = self._shown_grid
+        if shown is None or len(shown) != len(grid):
+            self._draw_board()
+            return
+        if shown == grid:
+            return
+        itemconfig = self.canvas.itemconfig
+        items = self._cell_items
+        glyphs = self._glyphs
+        for i, v in enumerate(grid):
+            if v != shown[i]:
+                text, font, fill = glyphs[v]
+                itemconfig(items[i], text=text, font=font, fill=fill)
+        self._shown_grid = bytes(grid)
 
     def _on_canvas_click(self, event) -> None:
         if not self.game:
@@ -171,7 +235,7 @@ class GUIClient:
             messagebox.showwarning("非法落子", str(e))
             return
 
-        self._draw_board()
+        self._refresh_cells()
         self._update_status()
         self._check_game_end()
 
@@ -183,7 +247,7 @@ class GUIClient:
         except Exception as e:
             messagebox.showwarning("悔棋失败", str(e))
             return
-        self._draw_board()
+        self._refresh_cells()
         self._update_status()
 
     def _on_pass(self) -> None:
@@ -194,7 +258,7 @@ class GUIClient:
         except Exception as e:
             messagebox.showwarning("操作失败", str(e))
             return
-        self._draw_board()
+        self._refresh_cells()
         self._update_status()
         self._check_game_end()
 
@@ -43,6 +43,84 @@ class TestBoard(unittest.TestCase):
         with self.assertRaises(InvalidPositionError):
             self.board.remove_piece(10, 0)
 
+    def test_flat_cell_layout(self):
+        # kernels, saves and renderers read the grid as row-major cell codes
+        self.board.place_piece(0, 2, "black")
+        self.board.place_piece(2, 1, "white")
+        self.assertIsInstance(self.board._grid, bytearray)
+        self.assertEqual(bytes(self.board._grid), bytes([0, 0, 1, 0, 0, 0, 0, 2, 0]))
+
+    def test_count(self):
+        self.board.place_piece(0, 0, "black")
+        self.board.place_piece(1, 1, "black")
+        self.board.place_piece(2, 2, "white")
+        self.assertEqual(self.board.count("black"), 2)
+        self.assertEqual(self.board.count("white"), 1)
+        self.assertEqual(self.board.count("empty"), 6)
+
+    def test_b64_round_trip(self):
+        self.board.place_piece(0, 1, "black")
+        self.board.place_piece(2, 2, "white")
+        other = Board(3)
+        other._load_b64(self.board._to_b64())
+        self.assertEqual(other.get_piece(0, 1), "black")
+        self.assertEqual(other.get_piece(2, 2), "white")
+        self.assertEqual(other.count("empty"), 7)
+        with self.assertRaises(ValueError):
+            other._load_b64("not base64!")
+        with self.assertRaises(ValueError):
+            Board(2)._load_b64(self.board._to_b64())
+
+    def test_restore_from_grid(self):
+        rows = [["black", "empty", "empty"],
+                ["empty", "white", "empty"],
+                ["empty", "empty", "black"]]
+        self.board.restore_from_grid(rows)
+        self.assertEqual(self.board.get_piece(1, 1), "white")
+        self.assertEqual(self.board.count("black"), 2)
+        # a flat row-major list works too and replaces the whole board
+        flat = ["empty"] * 9
+        flat[5] = "black"
+        self.board.restore_from_grid(flat)
+        self.assertEqual(self.board.get_piece(1, 2), "black")
+        self.assertEqual(self.board.count("empty"), 8)
+        with self.assertRaises(ValueError):
+            self.board.restore_from_grid(rows[:2])
+        with self.assertRaises(ValueError):
+            self.board.restore_from_grid(["green"] * 9)
+
+    def test_hash(self):
+        self.assertEqual(self.board.hash(), 0)
+        self.board.place_piece(0, 0, "black")
+        self.board.place_piece(1, 2, "white")
+        h = self.board.hash()
+        self.assertNotEqual(h, 0)
+        # same position reached another way (and via a bulk load) hashes equal
+        other = Board(3)
+        other.place_piece(1, 2, "white")
+        other.place_piece(0, 0, "black")
+        self.assertEqual(other.hash(), h)
+        other._load_b64(self.board._to_b64())
+        self.assertEqual(other.hash(), h)
+        self.board.remove_piece(1, 2)
+        self.board.remove_piece(0, 0)
+        self.assertEqual(self.board.hash(), 0)
+
+    def test_clear(self):
+        self.board.place_piece(0, 0, "black")
+        self.board.place_piece(2, 2, "white")
+        self.board.clear()
+        self.assertEqual(self.board.count("empty"), 9)
+        self.assertEqual(self.board.hash(), 0)
+        # placing after a clear behaves as on a new board
+        self.board.place_piece(0, 0, "white")
+        self.assertEqual(self.board.get_piece(0, 0), "white")
+
+    def test_slotted(self):
+        self.assertFalse(hasattr(self.board, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.board.extra = 1
+
     def test_iter_positions_count(self):
         coords = list(self.board.iter_positions())
         self.assertEqual(len(coords), self.board.get_size() ** 2)
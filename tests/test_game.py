@@ -39,6 +39,23 @@ class TestGame(unittest.TestCase):
         self.assertEqual(self.board.get_piece(0, 0), "empty")
         self.assertEqual(self.game.current_player, self.black)
 
+    def test_stones_placed_counter(self):
+        self.game.make_move(0, 0)
+        self.game.make_move(1, 1)
+        self.assertEqual(self.game._stones_placed, 2)
+        # a failed move onto an occupied cell changes nothing: no count,
+        # no history entry, no turn switch
+        history_len = len(self.game._history)
+        with self.assertRaises(ValueError):
+            self.game.make_move(1, 1)
+        self.assertEqual(self.game._stones_placed, 2)
+        self.assertEqual(len(self.game._history), history_len)
+        self.assertEqual(self.game.current_player, self.black)
+        # so undo takes back the last real move
+        self.game.undo()
+        self.assertEqual(self.game._stones_placed, 1)
+        self.assertEqual(self.board.get_piece(1, 1), "empty")
+
     def test_pass_and_undo(self):
         self.assertEqual(self.game.current_player, self.black)
         self.game.pass_turn()
@@ -56,6 +73,13 @@ class TestGame(unittest.TestCase):
         self.assertFalse(self.game.is_over())
         self.assertIsNone(self.game.get_winner())
 
+    def test_status_assignment_updates_is_over(self):
+        # loaders assign status directly; is_over must follow
+        self.game.status = GameStatus.DRAW
+        self.assertTrue(self.game.is_over())
+        self.game.status = GameStatus.ONGOING
+        self.assertFalse(self.game.is_over())
+
     def test_pass_default_not_implemented_on_base(self):
         # ensure base class pass_turn raises NotImplementedError
         b = Board(3)
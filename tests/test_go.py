@@ -1,13 +1,15 @@
 import unittest
+from itertools import starmap
 
 from src.core.player import Player
 from src.core.go import GoGame
 from src.core.game import GameStatus
+from src.core._go_numba import _chain_stones_py, chain_stones
 
 
 def play_sequence(game, moves):
-    for r, c in moves:
-        game.make_move(r, c)
+    for _ in starmap(game.make_move, moves):
+        pass
 
 
 class TestGoGame(unittest.TestCase):
@@ -32,6 +34,17 @@ class TestGoGame(unittest.TestCase):
         # White captured 1 black stone
         self.assertEqual(g.captured_white, 4)
 
+    def test_reset_after_capture(self):
+        g = GoGame(3, self.black, self.white)
+        play_sequence(g, [(1, 1), (1, 0), (0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1)])
+        g.reset()
+        self.assertEqual(g.captured_white, 0)
+        self.assertEqual(g.board.count("empty"), 9)
+        self.assertEqual(g.current_player, self.black)
+        # the superko history restarts, so the opening can be replayed
+        play_sequence(g, [(1, 1), (1, 0)])
+        self.assertEqual(g.board.get_piece(1, 0), "white")
+
     def test_suicide_illegal(self):
         g = GoGame(3, self.black, self.white)
         moves = [
@@ -88,6 +101,41 @@ class TestGoGame(unittest.TestCase):
         self.assertEqual(g.board.get_piece(0, 0), "empty")
         self.assertEqual(g.board.get_piece(0, 2), "empty")
 
+    def test_ko_recapture_illegal(self):
+        g = GoGame(4, self.black, self.white)
+        moves = [
+            (0, 1), (0, 2),
+            (1, 0), (1, 3),
+            (2, 1), (2, 2),
+            (3, 0), (1, 1),
+            (1, 2),  # B captures W(1,1)
+        ]
+        play_sequence(g, moves)
+        self.assertEqual(g.board.get_piece(1, 1), "empty")
+        # immediate recapture would recreate the previous position
+        with self.assertRaises(ValueError):
+            g.make_move(1, 1)
+        self.assertEqual(g.board.get_piece(1, 1), "empty")
+        self.assertEqual(g.board.get_piece(1, 2), "black")
+        self.assertEqual(g.current_player, self.white)
+        # undoing the capture lets the history unwind normally
+        g.undo()
+        self.assertEqual(g.board.get_piece(1, 1), "white")
+        self.assertEqual(g.board.get_piece(1, 2), "empty")
+
+    def test_chain_stones(self):
+        # 3x3 grid: 1 = black, 2 = white, 0 = empty
+        grid = bytearray([
+            1, 1, 0,
+            2, 1, 2,
+            1, 2, 2,
+        ])
+        # the kernel (when Numba is installed) and the Python fallback agree
+        for find in (chain_stones, _chain_stones_py):
+            self.assertEqual(sorted(find(grid, 3, 0)), [0, 1, 4])
+            self.assertEqual(find(grid, 3, 6), [6])
+            self.assertEqual(sorted(find(grid, 3, 5)), [5, 7, 8])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,23 +1,34 @@
+import random
 import unittest
+from itertools import starmap
 
 from src.core.gomoku import GomokuGame
+from src.core._gomoku_numba import _has_five_py, _rays, has_five
 from src.core.player import Player
 from src.core.game import GameStatus
 
 
 def play_sequence(game, moves):
-    """Helper: play moves in order. Each entry is (r, c)."""
-    for r, c in moves:
-        game.make_move(r, c)
+    """Helper: play moves in order. Each entry is (r, c); `moves` may be
+    any iterable, it is consumed lazily."""
+    for _ in starmap(game.make_move, moves):
+        pass
 
 
 class TestGomoku(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.black = Player("B", "black")
+        cls.white = Player("W", "white")
+        # one 5x5 game shared by the tests, reset before each
+        cls._game = GomokuGame(5, cls.black, cls.white)
+
     def setUp(self):
-        self.black = Player("B", "black")
-        self.white = Player("W", "white")
+        self._game.reset()
+        self.g = self._game
 
     def test_horizontal_win(self):
-        g = GomokuGame(5, self.black, self.white)
+        g = self.g
         # alternate moves so black places at (0,0)-(0,4)
         moves = [
             (0, 0), (4, 4),
@@ -30,9 +41,13 @@ class TestGomoku(unittest.TestCase):
         self.assertTrue(g.is_over())
         self.assertEqual(g.status, GameStatus.BLACK_WIN)
         self.assertEqual(g.get_winner(), self.black)
+        # no further moves once the game is decided
+        with self.assertRaises(ValueError):
+            g.make_move(2, 2)
+        self.assertEqual(g.board.get_piece(2, 2), "empty")
 
     def test_vertical_win(self):
-        g = GomokuGame(5, self.black, self.white)
+        g = self.g
         moves = [
             (0, 0), (4, 4),
             (1, 0), (4, 3),
@@ -44,38 +59,142 @@ class TestGomoku(unittest.TestCase):
         self.assertEqual(g.status, GameStatus.BLACK_WIN)
 
     def test_diagonal_win(self):
-        g = GomokuGame(5, self.black, self.white)
+        g = self.g
         moves = [
-            (0, 0), (4, 4),
-            (1, 1), (4, 3),
+            (0, 0), (4, 0),
+            (1, 1), (4, 1),
             (2, 2), (4, 2),
-            (3, 3), (4, 1),
+            (3, 3), (4, 3),
             (4, 4)
         ]
-        # Note: last move duplicates a white move in dummy zone; adjust last for black
-        moves[-1] = (4, 4)  # black final move at (4,4)
-        # But (4,4) already used by white as first green move; to ensure not occupied, change white dummy placements
-        # Rebuild moves with white placed at safe spots (3,4), (3,3), (3,2), (3,1)
-        g = GomokuGame(5, self.black, self.white)
+        play_sequence(g, moves)
+        self.assertEqual(g.status, GameStatus.BLACK_WIN)
+
+    def test_row_wrap_is_not_a_line(self):
+        g = self.g
+        # black's cells are consecutive in row-major order, but split
+        # across the end of row 0 and the start of row 1
         moves = [
-            (0, 0), (3, 4),
-            (1, 1), (3, 3),
-            (2, 2), (3, 2),
-            (3, 3), (3, 1),
-            (4, 4)
+            (0, 2), (4, 0),
+            (0, 3), (4, 1),
+            (0, 4), (4, 2),
+            (1, 0), (3, 0),
+            (1, 1)
         ]
-        # Adjust: ensure not placing on same spot; instead use distinct safe white moves
-        g = GomokuGame(5, self.black, self.white)
+        play_sequence(g, moves)
+        self.assertEqual(g.status, GameStatus.ONGOING)
+
+    def test_anti_diagonal_win(self):
+        g = self.g
         moves = [
-            (0, 0), (4, 0),
-            (1, 1), (4, 1),
-            (2, 2), (4, 2),
-            (3, 3), (4, 3),
-            (4, 4)
+            (0, 4), (0, 0),
+            (1, 3), (0, 1),
+            (2, 2), (0, 2),
+            (3, 1), (1, 0),
+            (4, 0)
         ]
         play_sequence(g, moves)
         self.assertEqual(g.status, GameStatus.BLACK_WIN)
 
+    def test_has_five(self):
+        # 6x6 grid: black (1) has four on row 0 and five on the anti-diagonal
+        grid = bytearray(36)
+        for c in range(4):
+            grid[c] = 1
+        for i in range(5):
+            grid[i * 6 + (5 - i)] = 1
+        # the kernel (when Numba is installed) and the Python fallback agree
+        for check in (has_five, _has_five_py):
+            self.assertFalse(check(grid, 6, 0, 0, 1))
+            self.assertTrue(check(grid, 6, 2, 3, 1))
+            self.assertFalse(check(grid, 6, 2, 3, 2))
+
+    def test_mover_code_is_plain_int(self):
+        # the kernel is called with the mover's color_id; an IntEnum
+        # member there would send every call through Numba's slow typing
+        for player in (self.black, self.white):
+            self.assertIs(type(player.color_id), int)
+
+    def test_has_five_anywhere(self):
+        g = GomokuGame(6, self.black, self.white)
+        # white five on the anti-diagonal ending in the bottom-left corner,
+        # black cells that are consecutive only across row ends
+        grid = ["empty"] * 36
+        for i in range(5):
+            grid[(i + 1) * 6 + (4 - i)] = "white"
+        for i in (3, 4, 5, 6, 7):
+            grid[i] = "black"
+        g.board.restore_from_grid(grid)
+        self.assertTrue(g.has_five_anywhere("white"))
+        self.assertFalse(g.has_five_anywhere("black"))
+        # agrees with the per-move check over every cell on random boards
+        rng = random.Random(7)
+        for _ in range(200):
+            cells = [rng.choice(("empty", "black", "black", "white")) for _ in range(36)]
+            g.board.restore_from_grid(cells)
+            expected = any(
+                has_five(g.board._grid, 6, i // 6, i % 6, 1)
+                for i in range(36) if cells[i] == "black"
+            )
+            self.assertEqual(g.has_five_anywhere("black"), expected)
+
+    def test_load_rejects_ongoing_game_with_five(self):
+        g = self.g
+        play_sequence(g, [(0, 0), (4, 0), (0, 1), (4, 1), (0, 2), (4, 2), (0, 3), (4, 3), (0, 4)])
+        state = g.to_state_dict()
+        # saved as won: loads fine
+        loaded = GomokuGame(5, self.black, self.white)
+        loaded.apply_state_dict(state)
+        self.assertEqual(loaded.status, GameStatus.BLACK_WIN)
+        # the same board marked ongoing is not a reachable position
+        state["status"] = "ONGOING"
+        with self.assertRaises(ValueError):
+            GomokuGame(5, self.black, self.white).apply_state_dict(state)
+
+    def test_load_rejects_counts_alternating_play_cannot_reach(self):
+        # four black stones in row 0, no white, black to move
+        rows = [["empty"] * 5 for _ in range(5)]
+        for c in range(4):
+            rows[0][c] = "black"
+        state = {"grid": rows, "current_color": "black", "status": "ONGOING"}
+        with self.assertRaises(ValueError):
+            GomokuGame(5, self.black, self.white).apply_state_dict(state)
+        # with four white stones as well the position is reachable, and
+        # the fifth black stone (ninth in all) wins
+        for c in range(4):
+            rows[2][c] = "white"
+        g = GomokuGame(5, self.black, self.white)
+        g.apply_state_dict(state)
+        g.make_move(0, 4)
+        self.assertEqual(g.status, GameStatus.BLACK_WIN)
+
+    def test_rays(self):
+        # 5x5: a five fits through the center in all four directions, a
+        # corner in three (row, column, one diagonal), an edge middle in two
+        rays = _rays(5)
+        self.assertEqual(len(rays[12]), 4)
+        self.assertEqual(len(rays[0]), 3)
+        self.assertEqual(len(rays[2]), 2)
+        # horizontal rays from (0, 2): cut off at the board edge
+        self.assertEqual(rays[2][0], ((3, 4), (1, 0)))
+        # nothing fits on a board smaller than 5
+        self.assertEqual(_rays(4), ((),) * 16)
+        # at most four cells on either side
+        self.assertEqual(_rays(15)[7][0], ((8, 9, 10, 11), (6, 5, 4, 3)))
+
+    def test_position_hash_follows_moves_and_undo(self):
+        a = self.g
+        b = GomokuGame(5, self.black, self.white)
+        play_sequence(a, [(0, 0), (1, 1), (2, 2), (3, 3)])
+        # same stones, other order: same position, same hash
+        play_sequence(b, [(2, 2), (3, 3), (0, 0), (1, 1)])
+        self.assertEqual(a.board.hash(), b.board.hash())
+        before = a.board.hash()
+        a.make_move(4, 4)
+        self.assertNotEqual(a.board.hash(), before)
+        a.undo()
+        self.assertEqual(a.board.hash(), before)
+
     def test_draw(self):
         g = GomokuGame(3, self.black, self.white)
         # fill the 3x3 board without five in a row
@@ -89,7 +208,7 @@ class TestGomoku(unittest.TestCase):
         self.assertEqual(g.status, GameStatus.DRAW)
 
     def test_undo(self):
-        g = GomokuGame(5, self.black, self.white)
+        g = self.g
         # set up 4 in a row and then the winning move
         moves = [
             (0, 0), (4, 4),
@@ -106,6 +225,25 @@ class TestGomoku(unittest.TestCase):
         self.assertEqual(g.get_winner(), None)
         self.assertEqual(g.board.get_piece(0, 4), "empty")
 
+    def test_slotted(self):
+        self.assertFalse(hasattr(self.g, "__dict__"))
+
+    def test_reset(self):
+        g = self.g
+        play_sequence(g, [(0, 0), (1, 1), (0, 1), (1, 2), (0, 2), (1, 3), (0, 3), (1, 4), (0, 4)])
+        self.assertTrue(g.is_over())
+        g.reset()
+        self.assertFalse(g.is_over())
+        self.assertEqual(g.current_player, self.black)
+        self.assertEqual(g.board.count("empty"), 25)
+        self.assertEqual(g.board.hash(), 0)
+        self.assertEqual(g._stones_placed, 0)
+        with self.assertRaises(ValueError):
+            g.undo()
+        # the reset game plays like a new one
+        play_sequence(g, [(2, 2), (3, 3)])
+        self.assertEqual(g.board.get_piece(3, 3), "white")
+
 
 if __name__ == "__main__":
     unittest.main()
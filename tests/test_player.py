@@ -1,5 +1,6 @@
 import unittest
 
+from src.core.board import Board, Piece
 from src.core.player import Player
 
 
@@ -10,6 +11,24 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(p.name, "Alice")
         self.assertEqual(p.color, "black")
 
+    def test_color_id(self):
+        self.assertEqual(Player("Alice", "black").color_id, Piece.BLACK)
+        self.assertEqual(Player("Bob", "white").color_id, Piece.WHITE)
+
+    def test_frozen_and_hashable(self):
+        p = Player("Alice", "black")
+        with self.assertRaises(AttributeError):
+            p.color = "white"  # type: ignore[misc]
+        self.assertEqual(hash(p), hash(Player("Alice", "black")))
+        self.assertFalse(hasattr(p, "__dict__"))
+
+    def test_color_is_canonical(self):
+        # a color string built at runtime is replaced by the shared object
+        color = "".join(["bl", "ack"])
+        board = Board(1)
+        board.place_piece(0, 0, "black")
+        self.assertIs(Player("Alice", color).color, board.get_piece(0, 0))
+
     def test_invalid_name(self):
         with self.assertRaises(ValueError):
             Player("", "white")
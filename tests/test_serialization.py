@@ -0,0 +1,101 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src.client.console_client import ConsoleClient
+from src.core.factory import GameFactory
+from src.core.game import GameStatus
+from src.core.serialization import load_game, save_game
+
+
+def play_capture(game):
+    """Helper: white captures the black stone at (0, 0) on a Go board."""
+    for r, c in [(0, 0), (0, 1), (4, 4), (1, 0)]:
+        game.make_move(r, c)
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "game.json")
+        self.console = ConsoleClient(GameFactory)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def console_cmd(self, handler, *args):
+        # the console prints progress messages; keep test output clean
+        with contextlib.redirect_stdout(io.StringIO()):
+            return handler(*args)
+
+    def assertSameGame(self, a, b):
+        self.assertEqual(type(a), type(b))
+        self.assertEqual(a.board._grid, b.board._grid)
+        self.assertIs(a.current_player.color, b.current_player.color)
+        self.assertEqual(a.status, b.status)
+
+    def test_round_trip_go(self):
+        game = GameFactory.create_game("go", 5)
+        play_capture(game)
+        save_game(game, self.path)
+        loaded = load_game(self.path, GameFactory)
+        self.assertSameGame(game, loaded)
+        self.assertEqual(loaded.captured_white, 1)
+        self.assertEqual(loaded._stones_placed, 3)
+
+    def test_round_trip_finished_gomoku(self):
+        game = GameFactory.create_game("gomoku", 9)
+        for c in range(4):
+            game.make_move(0, c)
+            game.make_move(8, c)
+        game.make_move(0, 4)
+        save_game(game, self.path)
+        loaded = load_game(self.path, GameFactory)
+        self.assertSameGame(game, loaded)
+        self.assertEqual(loaded.status, GameStatus.BLACK_WIN)
+
+    def test_console_save_loads_in_gui(self):
+        # the GUI client loads through serialization.load_game
+        game = GameFactory.create_game("go", 5)
+        play_capture(game)
+        self.console_cmd(self.console._cmd_save, ["save", self.path], game, "go")
+        loaded = load_game(self.path, GameFactory)
+        self.assertSameGame(game, loaded)
+        self.assertEqual(loaded.captured_white, 1)
+
+    def test_gui_save_loads_in_console(self):
+        # the GUI client saves through serialization.save_game
+        game = GameFactory.create_game("gomoku", 7)
+        game.make_move(3, 3)
+        save_game(game, self.path)
+        current = GameFactory.create_game("go", 5)
+        loaded, game_type = self.console_cmd(self.console._cmd_load, ["load", self.path], current, "go")
+        self.assertEqual(game_type, "gomoku")
+        self.assertSameGame(game, loaded)
+
+    def test_legacy_grid_file(self):
+        # version 1 files stored rows of color strings and no version field
+        rows = [["empty"] * 3 for _ in range(3)]
+        rows[1][1] = "black"
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"game_type": "gomoku", "size": 3, "grid": rows,
+                       "current_color": "white", "status": "ONGOING"}, f)
+        loaded = load_game(self.path, GameFactory)
+        self.assertEqual(loaded.board.get_piece(1, 1), "black")
+        self.assertEqual(loaded.current_player.color, "white")
+        self.assertEqual(loaded._stones_placed, 1)
+
+    def test_invalid_file(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"game_type": "go", "size": 3, "grid": [["green"] * 3] * 3}, f)
+        with self.assertRaises(ValueError):
+            load_game(self.path, GameFactory)
+        with self.assertRaises(FileNotFoundError):
+            load_game(self.path + ".missing", GameFactory)
+
+
+if __name__ == "__main__":
+    unittest.main()